@@ -0,0 +1,94 @@
+import random
+import timeit
+
+
+class Hand:
+    """
+    A hand that keeps its score up to date as cards are added.
+
+    The total counts every ace as 11 until that would bust the hand, and
+    soft_aces is how many aces are still counted that way, so adding a card
+    is a constant time update instead of rescoring the whole hand. Cards are
+    never rewritten, unlike calculate_score() which swaps an 11 for a 1.
+
+    Scores match calculate_score() called after every card, except that
+    several aces are turned into ones at once when one card needs it
+    (hitting a soft 21 with an ace gives 12 here, not 22).
+    """
+
+    __slots__ = ("cards", "total", "soft_aces")
+
+    def __init__(self, cards=()):
+        self.cards = []
+        self.total = 0
+        self.soft_aces = 0
+        for card in cards:
+            self.add(card)
+
+    def add(self, card):
+        self.cards.append(card)
+        total = self.total + card
+        if card == 11:
+            self.soft_aces += 1
+        if total > 21:
+            while total > 21 and self.soft_aces:
+                total -= 10
+                self.soft_aces -= 1
+        self.total = total
+
+    @property
+    def score(self):
+        # Same convention as calculate_score(): 0 stands for a Blackjack
+        if len(self.cards) == 2 and self.total == 21:
+            return 0
+        return self.total
+
+    @property
+    def is_soft(self):
+        return self.soft_aces > 0
+
+
+def benchmark(calculate_score, deal_card, count=100_000):
+    """
+    Checks Hand against calculate_score() on random hands, then times both ways of
+    scoring a hand card by card as play_game() does.
+    Args:
+        calculate_score (callable): The list based scorer from main.py.
+        deal_card (callable): The card source from main.py.
+        count (int): The number of hands.
+    """
+    def rescore_each_card(cards):
+        hand = []
+        for card in cards:
+            hand.append(card)
+            score = calculate_score(hand)
+        return score
+
+    def add_each_card(cards):
+        hand = Hand()
+        for card in cards:
+            hand.add(card)
+        return hand.score
+
+    random.seed(0)
+    hands = []
+    for _ in range(count):
+        # Hands as play_game() builds them: keep drawing below 21, stopping at random
+        hand = Hand([deal_card(), deal_card()])
+        while hand.total < 21 and random.random() < 0.7:
+            hand.add(deal_card())
+        hands.append(hand.cards)
+    mismatches = sum(rescore_each_card(cards) != add_each_card(cards) for cards in hands)
+    print(f"Hands checked: {len(hands)}, differing from calculate_score(): {mismatches}")
+
+    # Long hands of small cards show how each approach grows with the number of cards
+    long_hands = [[2] * 10 for _ in range(count // 10)]
+    for label, sample in (("game hands", hands), ("10 card hands", long_hands)):
+        for name, scorer in (("calculate_score", rescore_each_card), ("Hand.add", add_each_card)):
+            seconds = timeit.timeit(lambda: [scorer(cards) for cards in sample], number=5)
+            print(f"{label}, {name}: {seconds / (5 * len(sample)) * 1e6:.2f} us per hand")
+
+
+if __name__ == "__main__":
+    from main import calculate_score, deal_card
+    benchmark(calculate_score, deal_card)
@@ -1,11 +1,14 @@
 from art import logo
+from hand import Hand
+import argparse
 import random
 
+CARDS = [11, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10]
+
 
 def deal_card():
     # Returns a random card from the deck.
-    cards = [11, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10]
-    return random.choice(cards)
+    return random.choice(CARDS)
 
 
 def calculate_score(cards_):
@@ -38,43 +41,93 @@ def compare(user_score, comp_score):
         return "You lose."
 
 
-def play_game():
+def play_game(advisor=None, deal=deal_card):
     print(logo)
 
-    user_cards = []
-    comp_cards = []
+    user_hand = Hand()
+    comp_hand = Hand()
     user_score = 0
     comp_score = 0
     is_game_over = False
 
     for _ in range(2):
-        user_cards.append(deal_card())
-        comp_cards.append(deal_card())
+        user_hand.add(deal())
+        comp_hand.add(deal())
 
     while not is_game_over:
-        user_score = calculate_score(user_cards)
-        comp_score = calculate_score(comp_cards)
+        user_score = user_hand.score
+        comp_score = comp_hand.score
 
-        print(f"Your cards: {user_cards}, current score: {user_score}")
-        print(f"Computer's first card: {comp_cards[0]}")
+        print(f"Your cards: {user_hand.cards}, current score: {user_score}")
+        print(f"Computer's first card: {comp_hand.cards[0]}")
 
         if user_score == 0 or comp_score == 0 or user_score > 21:
             is_game_over = True
         else:
+            if advisor:
+                move, hit_value, stand_value = advisor.advice(user_score, user_hand.is_soft, comp_hand.cards[0])
+                print(f"Advisor: {move} (expected value {hit_value:+.3f} hitting, {stand_value:+.3f} standing)")
             user_should_deal = input("Type 'y' to get another card, type 'n' to pass: ")
             if user_should_deal == "y":
-                user_cards.append(deal_card())
+                user_hand.add(deal())
             else:
                 is_game_over = True
 
     while comp_score != 0 and comp_score < 17:
-        comp_cards.append(deal_card())
-        comp_score = calculate_score(comp_cards)
+        comp_hand.add(deal())
+        comp_score = comp_hand.score
 
-    print(f"Your final hand: {user_cards}, final score: {user_score}")
-    print(f"Computer's final hand: {comp_cards}, final score: {comp_score}")
+    print(f"Your final hand: {user_hand.cards}, final score: {user_score}")
+    print(f"Computer's final hand: {comp_hand.cards}, final score: {comp_score}")
     print(compare(user_score, comp_score))
 
 
-while input("Do you want to play a game of Blackjack? Type 'y' or 'n': ") == "y":
-    play_game()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play Blackjack, or simulate it without a player.")
+    parser.add_argument("--simulate", type=int, metavar="HANDS",
+                        help="play this many hands headlessly and report the outcome rates")
+    parser.add_argument("--stand-on", type=int, default=17,
+                        help="simulated player keeps hitting below this score (default: %(default)s)")
+    parser.add_argument("--optimal", action="store_true",
+                        help="simulated player follows the solved strategy tables instead of --stand-on")
+    parser.add_argument("--advise", action="store_true",
+                        help="show the best move from the solved strategy tables before each decision")
+    parser.add_argument("--decks", type=int,
+                        help="deal from a shoe of this many decks instead of an endless deck")
+    parser.add_argument("--penetration", type=float, default=0.75,
+                        help="share of the shoe dealt before it is reshuffled (default: %(default)s)")
+    parser.add_argument("--seed", type=int, help="random seed for the simulation")
+    parser.add_argument("--workers", type=int,
+                        help="split the simulation across this many processes; results are reproducible "
+                             "for a given seed and number of workers")
+    args = parser.parse_args()
+
+    if args.simulate:
+        # Imported here so that the interactive game does not need NumPy
+        from simulation import StandOn, TableStrategy, simulate, simulate_parallel
+        if args.optimal:
+            from strategy import StrategyTables
+            strategy = TableStrategy(StrategyTables.load_or_solve())
+        else:
+            strategy = StandOn(args.stand_on)
+
+        if args.workers:
+            tally, seed = simulate_parallel(args.simulate, strategy, args.workers, seed=args.seed,
+                                            decks=args.decks, penetration=args.penetration)
+            print(f"Seed: {seed}, workers: {args.workers}")
+            print(tally)
+        else:
+            print(simulate(args.simulate, strategy, seed=args.seed, decks=args.decks, penetration=args.penetration))
+    else:
+        advisor = None
+        if args.advise:
+            from strategy import StrategyTables
+            advisor = StrategyTables.load_or_solve()
+
+        deal = deal_card
+        if args.decks:
+            from shoe import Shoe
+            deal = Shoe(args.decks, args.penetration, seed=args.seed).deal
+
+        while input("Do you want to play a game of Blackjack? Type 'y' or 'n': ") == "y":
+            play_game(advisor, deal)
@@ -0,0 +1,60 @@
+from main import CARDS
+import numpy as np
+
+DECK_SIZE = 52
+
+
+class Shoe:
+    """
+    A finite shoe of several decks, dealt from a preallocated array.
+
+    Cards are dealt by moving a cursor along the shuffled array. Once the
+    cursor passes the penetration point the same array is shuffled again in
+    place, so dealing never allocates and costs O(1) per card.
+    """
+
+    def __init__(self, decks=6, penetration=0.75, seed=None, rng=None):
+        self.rng = rng or np.random.default_rng(seed)
+        # Each deck holds every card of CARDS four times, once per suit
+        self.cards = np.tile(np.array(CARDS, dtype=np.int8), 4 * decks)
+        self.view = memoryview(self.cards)  # Indexing a memoryview gives plain ints, without NumPy scalars
+        self.cut = int(len(self.cards) * penetration)
+        if not 0 < self.cut <= len(self.cards):
+            raise ValueError("Penetration must be more than 0 and at most 1.")
+        self.shuffle()
+
+    def __len__(self):
+        return len(self.cards)
+
+    @property
+    def remaining(self):
+        return len(self.cards) - self.cursor
+
+    def shuffle(self):
+        self.rng.shuffle(self.cards)
+        self.cursor = 0
+
+    def deal(self):
+        # Drop-in replacement for deal_card()
+        if self.cursor >= self.cut:
+            self.shuffle()
+        card = self.view[self.cursor]
+        self.cursor += 1
+        return card
+
+    def deal_many(self, n):
+        """
+        Deals n cards at once for headless code.
+        Args:
+            n (int): The number of cards, at most the size of the shoe.
+        Returns:
+            numpy.ndarray: A read-only view of the dealt cards, valid until the next shuffle.
+        """
+        if n > len(self.cards):
+            raise ValueError(f"Cannot deal {n} cards from a shoe of {len(self.cards)}.")
+        if self.cursor >= self.cut or n > self.remaining:
+            self.shuffle()
+        dealt = self.cards[self.cursor:self.cursor + n]
+        dealt.flags.writeable = False
+        self.cursor += n
+        return dealt
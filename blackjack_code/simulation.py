@@ -0,0 +1,251 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from main import CARDS, compare
+from shoe import Shoe
+from strategy import TOTALS, UPCARDS
+import math
+import numpy as np
+
+WIN, LOSE, DRAW = 0, 1, 2
+MAX_SCORE = 31  # Hitting on a hard 21 and drawing a ten
+CHUNK_SIZE = 1_000_000
+RUN = 12  # Shoe cards set aside for each hand, more than almost any hand needs
+DECK = np.array(CARDS, dtype=np.int8)
+
+
+def outcome_of(user_score, comp_score):
+    # Reduces the message from compare() to a win, loss or draw.
+    message = compare(user_score, comp_score)
+    if message == "Draw.":
+        return DRAW
+    elif "win" in message.lower():
+        return WIN
+    return LOSE
+
+
+# compare() evaluated once for every pair of scores, so whole arrays of hands can be judged by lookup
+OUTCOMES = np.array([[outcome_of(user, comp) for comp in range(MAX_SCORE + 1)] for user in range(MAX_SCORE + 1)],
+                    dtype=np.int8)
+
+
+class StandOn:
+    # Hits while the score is below a threshold, like a dealer standing on 17.
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+
+    def __call__(self, totals, soft, upcards):
+        return totals < self.threshold
+
+
+class TableStrategy:
+    # Hits whenever the solved strategy tables say hitting is worth more than standing.
+
+    def __init__(self, tables):
+        hit = np.frombuffer(tables.hit, dtype=np.float64)
+        stand = np.frombuffer(tables.stand, dtype=np.float64)
+        self.hits = (hit > stand).reshape(2, TOTALS, UPCARDS)
+
+    def __call__(self, totals, soft, upcards):
+        return self.hits[soft.astype(np.intp), totals, upcards]
+
+
+class Tally:
+    # Win, loss and draw counts over a number of simulated hands.
+
+    def __init__(self, wins=0, losses=0, draws=0):
+        self.wins = wins
+        self.losses = losses
+        self.draws = draws
+
+    @property
+    def hands(self):
+        return self.wins + self.losses + self.draws
+
+    def add(self, outcomes):
+        counts = np.bincount(outcomes, minlength=3)
+        self.wins += int(counts[WIN])
+        self.losses += int(counts[LOSE])
+        self.draws += int(counts[DRAW])
+
+    def merge(self, other):
+        return Tally(self.wins + other.wins, self.losses + other.losses, self.draws + other.draws)
+
+    def rate(self, count, z=1.96):
+        # Returns the observed rate with the half width of its normal approximation confidence interval.
+        p = count / self.hands
+        return p, z * math.sqrt(p * (1 - p) / self.hands)
+
+    def __str__(self):
+        lines = [f"Hands played: {self.hands}"]
+        for name, count in (("Win", self.wins), ("Lose", self.losses), ("Draw", self.draws)):
+            p, half_width = self.rate(count)
+            lines.append(f"{name}: {p:.4%} +/- {half_width:.4%} (95% CI)")
+        return "\n".join(lines)
+
+
+def draw_cards(rng, n):
+    return DECK[rng.integers(0, len(DECK), size=n)]
+
+
+def deal_runs(shoe, n):
+    # Deals n runs of RUN consecutive cards, never starting a run past the cut unless the shoe is smaller than a run
+    runs = np.empty((n, RUN), dtype=np.int8)
+    done = 0
+    while done < n:
+        fit = (shoe.cut - shoe.cursor) // RUN
+        if fit < 1:
+            shoe.shuffle()
+            fit = max(shoe.cut // RUN, 1)
+        count = min(fit, n - done)
+        runs[done:done + count] = shoe.deal_many(count * RUN).reshape(count, RUN)
+        done += count
+    return runs
+
+
+class ShoeDealer:
+    """
+    Deals a batch of hands from a Shoe.
+
+    Every hand gets its own run of RUN consecutive cards from the shoe, so
+    the cards within a hand and from one hand to the next come out of the
+    same shuffled shoe, as at a table. Cards a hand does not use are burned.
+    A hand that needs more than RUN cards takes the rest from the shoe one
+    by one.
+    """
+
+    def __init__(self, shoe, n):
+        self.shoe = shoe
+        self.runs = deal_runs(shoe, n)
+        self.positions = np.zeros(n, dtype=np.intp)
+
+    def __call__(self, hands):
+        positions = self.positions[hands]
+        cards = self.runs[hands, np.minimum(positions, RUN - 1)]
+        for i in np.flatnonzero(positions >= RUN):
+            cards[i] = self.shoe.deal()
+        self.positions[hands] += 1
+        return cards
+
+
+def add_cards(totals, soft, cards):
+    # Adds one card to each hand, counting aces as 1 instead of 11 for as long as the hand would bust.
+    totals += cards
+    soft += cards == 11
+    # One new card can need at most two aces turned into ones: soft 21 plus an ace is 32
+    for _ in range(2):
+        convert = (totals > 21) & (soft > 0)
+        totals -= 10 * convert
+        soft -= convert
+
+
+def play_hands(n, strategy, rng, shoe=None):
+    """
+    Plays n hands at once with the rules of play_game().
+    Args:
+        n (int): The number of hands.
+        strategy (callable): Takes the player's totals, soft flags and the dealer's up cards
+            and returns which hands hit.
+        rng (numpy.random.Generator): The random source.
+        shoe (Shoe): Deal from this shoe instead of an endless deck.
+    Returns:
+        numpy.ndarray: WIN, LOSE or DRAW for every hand.
+    """
+    if shoe is None:
+        def deal(hands):
+            return draw_cards(rng, hands.size)
+    else:
+        deal = ShoeDealer(shoe, n)
+    everyone = np.arange(n)
+
+    user_totals = np.zeros(n, dtype=np.int16)
+    user_soft = np.zeros(n, dtype=np.int16)
+    comp_totals = np.zeros(n, dtype=np.int16)
+    comp_soft = np.zeros(n, dtype=np.int16)
+
+    add_cards(user_totals, user_soft, deal(everyone))
+    upcards = deal(everyone)
+    add_cards(comp_totals, comp_soft, upcards)
+    add_cards(user_totals, user_soft, deal(everyone))
+    add_cards(comp_totals, comp_soft, deal(everyone))
+
+    # Two cards making 21 score 0 in calculate_score() and end the game before anyone hits
+    user_blackjack = user_totals == 21
+    comp_blackjack = comp_totals == 21
+
+    playing = np.flatnonzero(~(user_blackjack | comp_blackjack))
+    while playing.size:
+        playing = playing[strategy(user_totals[playing], user_soft[playing] > 0, upcards[playing])]
+        if not playing.size:
+            break
+        totals, soft = user_totals[playing], user_soft[playing]
+        add_cards(totals, soft, deal(playing))
+        user_totals[playing], user_soft[playing] = totals, soft
+        playing = playing[totals <= 21]
+
+    drawing = np.flatnonzero(~comp_blackjack & (comp_totals < 17))
+    while drawing.size:
+        totals, soft = comp_totals[drawing], comp_soft[drawing]
+        add_cards(totals, soft, deal(drawing))
+        comp_totals[drawing], comp_soft[drawing] = totals, soft
+        drawing = drawing[totals < 17]
+
+    user_scores = np.where(user_blackjack, 0, user_totals)
+    comp_scores = np.where(comp_blackjack, 0, comp_totals)
+    return OUTCOMES[user_scores, comp_scores]
+
+
+def simulate(hands, strategy, seed=None, rng=None, decks=None, penetration=0.75):
+    """
+    Plays a number of hands headlessly in NumPy batches.
+    Args:
+        hands (int): The number of hands to play.
+        strategy (callable): Decides which hands hit, see play_hands().
+        seed (int): Seed for a new random generator, used when rng is not given.
+        rng (numpy.random.Generator): The random source.
+        decks (int): Deal from a Shoe of this many decks, shuffled by rng, instead of an endless deck.
+        penetration (float): Share of the shoe dealt before it is reshuffled.
+    Returns:
+        Tally: The outcome counts.
+    """
+    rng = rng or np.random.default_rng(seed)
+    shoe = Shoe(decks, penetration, rng=rng) if decks else None
+    tally = Tally()
+    for start in range(0, hands, CHUNK_SIZE):
+        tally.add(play_hands(min(CHUNK_SIZE, hands - start), strategy, rng, shoe))
+    return tally
+
+
+def simulate_share(hands, strategy, seed_sequence, decks=None, penetration=0.75):
+    # Runs in a worker process with its own independent random stream, and its own shoe when decks is given.
+    return simulate(hands, strategy, rng=np.random.default_rng(seed_sequence), decks=decks, penetration=penetration)
+
+
+def simulate_parallel(hands, strategy, workers, seed=None, decks=None, penetration=0.75):
+    """
+    Splits the hands across worker processes and adds up their tallies.
+    Every worker draws from its own stream spawned from one SeedSequence, so the
+    result only depends on the seed and the number of workers.
+    Args:
+        hands (int): The number of hands to play.
+        strategy (callable): Decides which hands hit, see play_hands(). Must be picklable.
+        workers (int): The number of worker processes.
+        seed (int): The root seed. A random one is used when None.
+        decks (int): Deal from a Shoe of this many decks in every worker instead of an endless deck.
+        penetration (float): Share of each shoe dealt before it is reshuffled.
+    Returns:
+        tuple: The merged Tally and the root seed, so that the run can be repeated.
+    """
+    seed_sequence = np.random.SeedSequence(seed)
+    shares = [hands // workers + (worker < hands % workers) for worker in range(workers)]
+    streams = seed_sequence.spawn(workers)
+
+    if workers == 1:
+        tallies = [simulate_share(shares[0], strategy, streams[0], decks, penetration)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            tallies = list(pool.map(simulate_share, shares, [strategy] * workers, streams,
+                                    [decks] * workers, [penetration] * workers))
+
+    # Tallies are merged in worker order, so the sums never depend on which worker finished first
+    return reduce(Tally.merge, tallies, Tally()), seed_sequence.entropy
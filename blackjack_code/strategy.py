@@ -0,0 +1,170 @@
+from collections import Counter
+from functools import lru_cache
+from main import CARDS
+import array
+import os
+import struct
+
+BUST = 22
+DEALER_FINALS = [17, 18, 19, 20, 21, BUST]
+TOTALS = 22  # Player totals 0 to 21
+UPCARDS = 12  # Dealer up cards 2 to 11, indexed by value
+TABLE_SIZE = 2 * TOTALS * UPCARDS
+TABLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "strategy_tables.bin")
+MAGIC = b"BJST"
+HEADER = struct.Struct("<4sHHH")  # Magic, player totals, up cards, dealer finals
+
+# Same draw odds as deal_card(): every entry of CARDS is equally likely
+CARD_ODDS = [(card, count / len(CARDS)) for card, count in sorted(Counter(CARDS).items())]
+
+
+def add_card(total, soft, card):
+    # Adds a card to a hand given as its total and whether an ace in it still counts as 11.
+    total += card
+    soft_aces = soft + (card == 11)
+    while total > 21 and soft_aces:
+        total -= 10
+        soft_aces -= 1
+    return total, soft_aces > 0
+
+
+@lru_cache(maxsize=None)
+def dealer_finals(total, soft):
+    # Chances of the dealer ending on each of DEALER_FINALS from a hand, hitting below 17.
+    if total > 21:
+        return tuple(1.0 if final == BUST else 0.0 for final in DEALER_FINALS)
+    if total >= 17:
+        return tuple(1.0 if final == total else 0.0 for final in DEALER_FINALS)
+
+    chances = [0.0] * len(DEALER_FINALS)
+    for card, odds in CARD_ODDS:
+        for i, chance in enumerate(dealer_finals(*add_card(total, soft, card))):
+            chances[i] += odds * chance
+    return tuple(chances)
+
+
+def dealer_distribution(upcard):
+    """
+    Works out where the dealer ends up from an up card.
+    The player only gets to decide when the dealer has no Blackjack, so the
+    hole cards that would make one are left out.
+    Args:
+        upcard (int): The dealer's first card, 11 for an ace.
+    Returns:
+        list: The chance of each of DEALER_FINALS.
+    """
+    chances = [0.0] * len(DEALER_FINALS)
+    no_blackjack = 0.0
+    for card, odds in CARD_ODDS:
+        if upcard + card == 21:
+            continue
+        no_blackjack += odds
+        for i, chance in enumerate(dealer_finals(*add_card(upcard, upcard == 11, card))):
+            chances[i] += odds * chance
+    return [chance / no_blackjack for chance in chances]
+
+
+def stand_value(total, dealer):
+    # Expected result of standing, +1 for a win and -1 for a loss, judged like compare().
+    value = 0.0
+    for final, chance in zip(DEALER_FINALS, dealer):
+        if final == BUST or total > final:
+            value += chance
+        elif total < final:
+            value -= chance
+    return value
+
+
+def solve():
+    """
+    Computes the value of hitting and of standing for every hand against every up card.
+    Returns:
+        StrategyTables: The solved tables.
+    """
+    stand = array.array('d', bytes(8 * TABLE_SIZE))
+    hit = array.array('d', bytes(8 * TABLE_SIZE))
+    dealer = array.array('d', bytes(8 * UPCARDS * len(DEALER_FINALS)))
+
+    for upcard in range(2, UPCARDS):
+        distribution = dealer_distribution(upcard)
+        dealer[upcard * len(DEALER_FINALS):(upcard + 1) * len(DEALER_FINALS)] = array.array('d', distribution)
+
+        @lru_cache(maxsize=None)
+        def values(total, soft):
+            # (stand, hit) for a hand that is still deciding, playing on optimally after a hit
+            hit_value = 0.0
+            for card, odds in CARD_ODDS:
+                new_total, new_soft = add_card(total, soft, card)
+                hit_value += odds * (-1.0 if new_total > 21 else max(values(new_total, new_soft)))
+            return stand_value(total, distribution), hit_value
+
+        for soft in (False, True):
+            for total in range(4, 22):
+                if soft and total < 12:
+                    continue
+                i = StrategyTables.position(total, soft, upcard)
+                stand[i], hit[i] = values(total, soft)
+
+    return StrategyTables(stand, hit, dealer)
+
+
+class StrategyTables:
+    """
+    Solved hit and stand values, answering advice in constant time.
+    The tables are laid out as [soft][total][up card] in flat arrays of doubles.
+    """
+
+    def __init__(self, stand, hit, dealer):
+        self.stand = stand
+        self.hit = hit
+        self.dealer = dealer
+
+    @staticmethod
+    def position(total, soft, upcard):
+        return (soft * TOTALS + total) * UPCARDS + upcard
+
+    def advice(self, total, soft, upcard):
+        """
+        Looks up the better move for a hand.
+        Args:
+            total (int): The player's score.
+            soft (bool): Whether an ace in the hand still counts as 11.
+            upcard (int): The dealer's first card, 11 for an ace.
+        Returns:
+            tuple: 'hit' or 'stand', then the expected values of hitting and standing.
+        """
+        i = self.position(total, soft, upcard)
+        return ("hit" if self.hit[i] > self.stand[i] else "stand"), self.hit[i], self.stand[i]
+
+    def dealer_distribution(self, upcard):
+        return dict(zip(DEALER_FINALS, self.dealer[upcard * len(DEALER_FINALS):(upcard + 1) * len(DEALER_FINALS)]))
+
+    def save(self, path=TABLES_PATH):
+        with open(path, 'wb') as tables_file:
+            tables_file.write(HEADER.pack(MAGIC, TOTALS, UPCARDS, len(DEALER_FINALS)))
+            self.stand.tofile(tables_file)
+            self.hit.tofile(tables_file)
+            self.dealer.tofile(tables_file)
+
+    @classmethod
+    def load(cls, path=TABLES_PATH):
+        with open(path, 'rb') as tables_file:
+            if HEADER.unpack(tables_file.read(HEADER.size)) != (MAGIC, TOTALS, UPCARDS, len(DEALER_FINALS)):
+                raise ValueError(f"'{path}' is not a strategy table file for this game.")
+            stand = array.array('d')
+            hit = array.array('d')
+            dealer = array.array('d')
+            stand.fromfile(tables_file, TABLE_SIZE)
+            hit.fromfile(tables_file, TABLE_SIZE)
+            dealer.fromfile(tables_file, UPCARDS * len(DEALER_FINALS))
+        return cls(stand, hit, dealer)
+
+    @classmethod
+    def load_or_solve(cls, path=TABLES_PATH):
+        # Solving only happens the first time, later runs read the saved tables.
+        try:
+            return cls.load(path)
+        except (OSError, EOFError, ValueError, struct.error):
+            tables = solve()
+            tables.save(path)
+            return tables
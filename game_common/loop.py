@@ -0,0 +1,73 @@
+import math
+import time
+FRAME_LENGTH = 1 / 60  # Shortest time between two renders, in seconds
+MAX_TICKS_PER_FRAME = 8
+
+
+class GameLoop:
+    """
+    Runs a game's ticks at a fixed rate on Tk's event loop.
+
+    Every frame adds the real time since the last one to an accumulator
+    from time.perf_counter() and runs one tick for each tick_length it
+    holds, so the tick rate does not drift with the time the ticks and the
+    rendering take. The screen is only redrawn when at least one tick ran,
+    and the next frame is scheduled with screen.ontimer() for when the next
+    tick is due, but never sooner than FRAME_LENGTH, so the loop sleeps in
+    Tk instead of blocking it or spinning. When the game falls behind, up to
+    MAX_TICKS_PER_FRAME ticks share one render and the rest of the backlog is
+    dropped, slowing the game down rather than freezing it.
+    """
+
+    def __init__(self, screen, tick, render, tick_length):
+        """
+        Args:
+            screen (turtle._Screen): The screen to schedule frames on and update.
+            tick (callable): Advances the game by one tick.
+            render (callable): Moves the turtles to the current game state.
+            tick_length (callable): Seconds per tick, read before every tick so the game can speed up.
+        """
+        self.screen = screen
+        self.tick = tick
+        self.render = render
+        self.tick_length = tick_length
+        self.running = False
+        self.last_frame = 0.0
+        self.accumulator = 0.0
+
+    def start(self):
+        self.running = True
+        self.last_frame = time.perf_counter()
+        self.accumulator = 0.0
+        self.render()
+        self.screen.update()
+        self.schedule()
+
+    def stop(self):
+        self.running = False
+
+    def schedule(self):
+        wait = max(self.tick_length() - self.accumulator, FRAME_LENGTH)
+        self.screen.ontimer(self.frame, math.ceil(wait * 1000))
+
+    def frame(self):
+        if not self.running:
+            return
+        now = time.perf_counter()
+        self.accumulator += now - self.last_frame
+        self.last_frame = now
+
+        ticks = 0
+        while self.running and self.accumulator >= self.tick_length():
+            self.accumulator -= self.tick_length()
+            self.tick()
+            ticks += 1
+            if ticks == MAX_TICKS_PER_FRAME:
+                self.accumulator = 0.0
+                break
+
+        if ticks:
+            self.render()
+            self.screen.update()
+        if self.running:
+            self.schedule()
@@ -0,0 +1,111 @@
+import argparse
+import random
+import struct
+MAGIC = b"TGRP"
+HEADER = struct.Struct("<4s8sQqII")  # Magic, game name, seed, starting high score, ticks, events
+EVENT = struct.Struct("<IB")  # Tick, index of the key in the game's KEYS
+SEED_LIMIT = 2 ** 64  # Seeds are saved as unsigned 64 bit numbers
+
+
+def new_seed():
+    return random.randrange(2 ** 63)
+
+
+def parse_seed(text):
+    # argparse type for --seed, so a seed that could not be saved in a replay is refused before the game starts
+    seed = int(text)
+    if not 0 <= seed < SEED_LIMIT:
+        raise argparse.ArgumentTypeError(f"seed must be between 0 and {SEED_LIMIT - 1}")
+    return seed
+
+
+class Recorder:
+    """
+    Records a live game so it can be played again without a window.
+
+    The engine draws every random number from a random.Random seeded with
+    seed, so the only other thing a session depends on is which keys came
+    in before which tick. bind() sends the game's keys to the engine as
+    before and logs each press as (tick, key), and step() counts the ticks.
+    A game that keeps a high score between sessions passes the one it
+    started with as high_score. save() writes the seed, that high score, the
+    tick count and the presses as fixed size binary records.
+    """
+
+    def __init__(self, game, keys, engine, seed=0, high_score=0):
+        self.game = game
+        self.keys = keys
+        self.engine = engine
+        self.seed = seed
+        self.high_score = high_score
+        self.tick = 0
+        self.events = bytearray()
+
+    def bind(self, listen):
+        """
+        Binds every key of the game to its engine action.
+        Args:
+            listen (callable): screen.onkey or screen.onkeypress.
+        """
+        for code, (key, action) in enumerate(self.keys.items()):
+            listen(self.recorded(code, getattr(self.engine, action)), key)
+
+    def recorded(self, code, action):
+        def press():
+            self.events += EVENT.pack(self.tick, code)
+            action()
+        return press
+
+    def step(self):
+        result = self.engine.step()
+        self.tick += 1
+        return result
+
+    def save(self, path):
+        # Packed before the file is opened, so a header that cannot be written leaves an existing replay alone
+        header = HEADER.pack(MAGIC, self.game.encode(), self.seed, self.high_score, self.tick,
+                             len(self.events) // EVENT.size)
+        with open(path, 'wb') as replay_file:
+            replay_file.write(header)
+            replay_file.write(self.events)
+
+
+class Replay:
+    """
+    A recorded session, read back by load() and run by play().
+    """
+
+    def __init__(self, seed, high_score, ticks, events):
+        self.seed = seed
+        self.high_score = high_score
+        self.ticks = ticks
+        self.events = events
+
+    @classmethod
+    def load(cls, path, game):
+        with open(path, 'rb') as replay_file:
+            magic, name, seed, high_score, ticks, count = HEADER.unpack(replay_file.read(HEADER.size))
+            if magic != MAGIC or name.rstrip(b"\0").decode() != game:
+                raise ValueError(f"'{path}' is not a {game} replay.")
+            events = list(EVENT.iter_unpack(replay_file.read(count * EVENT.size)))
+        return cls(seed, high_score, ticks, events)
+
+    def play(self, engine, keys):
+        """
+        Runs the recorded ticks and key presses on a fresh engine as fast as possible.
+        Args:
+            engine: An engine built with random.Random(self.seed) and high_score=self.high_score,
+                the same way the recorded game built it.
+            keys (dict): The game's KEYS, key name to engine action.
+        Returns:
+            The engine, in the state the recorded game ended in.
+        """
+        actions = [getattr(engine, action) for action in keys.values()]
+        events = iter(self.events)
+        tick, code = next(events, (self.ticks, 0))
+        for step in range(self.ticks):
+            while tick == step:
+                actions[code]()
+                tick, code = next(events, (self.ticks, 0))
+            engine.step()
+        return engine
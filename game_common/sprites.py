@@ -0,0 +1,53 @@
+class SpriteBatch:
+    """
+    Draws many shapes of one size straight on the turtle canvas.
+
+    A turtle per entity carries its own undo buffer, pen and shape state,
+    and has to be parked off screen when it is not needed. Here every
+    entity is a single rectangle or oval canvas item. render() takes plain
+    positions, in turtle coordinates, and moves the first items there with
+    one coords() call each. Items left over from a frame with more entities
+    are hidden and used again later, so the number of items only grows to
+    the most entities ever shown at once. Colors are only sent to Tk when
+    an item's color changes.
+    """
+
+    def __init__(self, screen, width, height, color="black", shape="rectangle"):
+        self.canvas = screen.getcanvas()
+        self.half_width = width / 2
+        self.half_height = height / 2
+        self.color = color
+        self.create = self.canvas.create_oval if shape == "oval" else self.canvas.create_rectangle
+        self.items = []
+        self.colors = []
+        self.shown = 0
+
+    def render(self, positions, colors=None):
+        """
+        Draws one shape at each position and hides the rest.
+        Args:
+            positions: A sequence of (x, y) pairs, such as a list of tuples or an (n, 2) NumPy array.
+            colors (list): An optional color for each position, otherwise every shape has the batch's color.
+        """
+        count = len(positions)
+        while len(self.items) < count:
+            self.items.append(self.create(0, 0, 0, 0, fill=self.color, outline=self.color, state="hidden"))
+            self.colors.append(self.color)
+
+        coords = self.canvas.coords
+        half_width = self.half_width
+        half_height = self.half_height
+        for i, (x, y) in enumerate(positions):
+            # The canvas has y pointing down
+            coords(self.items[i], x - half_width, -y - half_height, x + half_width, -y + half_height)
+        if colors is not None:
+            for i, color in enumerate(colors):
+                if color != self.colors[i]:
+                    self.canvas.itemconfigure(self.items[i], fill=color, outline=color)
+                    self.colors[i] = color
+
+        for item in self.items[count:self.shown]:
+            self.canvas.itemconfigure(item, state="hidden")
+        for item in self.items[self.shown:count]:
+            self.canvas.itemconfigure(item, state="normal")
+        self.shown = count
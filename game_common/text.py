@@ -0,0 +1,32 @@
+ANCHORS = {"left": "sw", "center": "s", "right": "se"}  # How turtle's write() anchors each alignment
+
+
+class CanvasText:
+    """
+    A piece of text on the turtle canvas that is only redrawn when it changes.
+
+    A scoreboard turtle runs clear() and write() on every point, which
+    deletes and creates canvas items in the middle of the game loop. This
+    creates its canvas item once, where write() would have put it. set()
+    only stores the new text and marks it dirty, and render(), called once
+    per frame, updates the item if anything changed since the last frame.
+    """
+
+    def __init__(self, screen, position, align="center", font=("Arial", 8, "normal"), color="black"):
+        self.canvas = screen.getcanvas()
+        x, y = position
+        # The canvas has y pointing down, the same offsets as turtle's write()
+        self.item = self.canvas.create_text(x - 1, -y, text="", anchor=ANCHORS[align], font=font, fill=color)
+        self.text = ""
+        self.dirty = False
+
+    def set(self, text):
+        text = str(text)
+        if text != self.text:
+            self.text = text
+            self.dirty = True
+
+    def render(self):
+        if self.dirty:
+            self.canvas.itemconfigure(self.item, text=self.text)
+            self.dirty = False
@@ -0,0 +1,133 @@
+WALL_Y = 290  # Furthest the centre of the ball gets from the middle before it bounces
+PADDLE_X = 350
+PADDLE_MOVE = 20
+PADDLE_HALF_WIDTH = 10
+PADDLE_HALF_HEIGHT = 50
+BALL_RADIUS = 10
+PADDLE_FACE_X = PADDLE_X - PADDLE_HALF_WIDTH - BALL_RADIUS  # Where the centre of the ball is when it hits a paddle
+PADDLE_REACH = PADDLE_HALF_HEIGHT + BALL_RADIUS
+GOAL_X = 380
+BALL_MOVE = 10
+START_SPEED = 0.1
+SPEED_UP = 0.9
+
+
+def fold(position, limit):
+    """
+    Finds where something bouncing between -limit and limit really is.
+    Args:
+        position (float): Where it would be if there were no walls, starting inside them.
+        limit (float): The distance from the middle to each wall.
+    Returns:
+        tuple: The position between the walls, then 1 or -1 for whether it now moves the same way or the other way.
+    """
+    offset = (position + limit) % (4 * limit)
+    if offset <= 2 * limit:
+        return offset - limit, 1
+    return 3 * limit - offset, -1
+
+
+class PongEngine:
+    """
+    The rules of Pong without any drawing.
+
+    Follows Ball, Paddle, Scoreboard and the checks in main.py: the ball
+    moves BALL_MOVE on both axes each tick, bounces off the top and bottom,
+    bounces off the paddles, and goes back to the middle towards the other
+    side when it passes GOAL_X. move_speed is the sleep between ticks in
+    the turtle game and does not affect the rules.
+
+    A tick sweeps the ball along its path instead of moving it and then
+    looking for overlaps, so it cannot pass through a paddle or bounce twice
+    however fast it goes. The walls are solved in closed form by fold(), and
+    a paddle is hit when the ball reaches PADDLE_FACE_X with its centre
+    within PADDLE_REACH of the paddle's. The only loop is over the paddle
+    hits inside one tick, which is one at most unless the ball crosses the
+    whole court in a single tick.
+    """
+
+    def __init__(self):
+        self.ball_x = 0
+        self.ball_y = 0
+        self.x_move = BALL_MOVE
+        self.y_move = BALL_MOVE
+        self.move_speed = START_SPEED
+        self.r_paddle_y = 0
+        self.l_paddle_y = 0
+        self.l_score = 0
+        self.r_score = 0
+
+    @property
+    def ball(self):
+        return self.ball_x, self.ball_y
+
+    @property
+    def r_paddle(self):
+        return PADDLE_X, self.r_paddle_y
+
+    @property
+    def l_paddle(self):
+        return -PADDLE_X, self.l_paddle_y
+
+    def r_paddle_up(self):
+        self.r_paddle_y += PADDLE_MOVE
+
+    def r_paddle_down(self):
+        self.r_paddle_y -= PADDLE_MOVE
+
+    def l_paddle_up(self):
+        self.l_paddle_y += PADDLE_MOVE
+
+    def l_paddle_down(self):
+        self.l_paddle_y -= PADDLE_MOVE
+
+    def bounce_x(self):
+        self.x_move *= -1
+        self.move_speed *= SPEED_UP
+
+    def reset_ball(self):
+        self.ball_x = 0
+        self.ball_y = 0
+        self.move_speed = START_SPEED
+        self.bounce_x()
+
+    def step(self):
+        """
+        Moves the ball one tick and applies the wall, paddle and goal rules.
+        Returns:
+            str: 'l' or 'r' for the side that scored this tick, otherwise None.
+        """
+        # Times are in ticks, y is tracked as if there were no walls and folded back between them when needed
+        x = self.ball_x
+        elapsed = 0.0
+        while True:
+            if self.x_move > 0:
+                face_x, paddle_y, goal_x = PADDLE_FACE_X, self.r_paddle_y, GOAL_X
+            else:
+                face_x, paddle_y, goal_x = -PADDLE_FACE_X, self.l_paddle_y, -GOAL_X
+
+            # Detect collision with the paddle the ball is heading for
+            time_to_face = (face_x - x) / self.x_move
+            if 0 <= time_to_face <= 1 - elapsed:
+                y, _ = fold(self.ball_y + self.y_move * (elapsed + time_to_face), WALL_Y)
+                if abs(y - paddle_y) <= PADDLE_REACH:
+                    elapsed += time_to_face
+                    x = face_x
+                    self.bounce_x()
+                    continue
+
+            # Detect if that paddle misses
+            if (goal_x - x) / self.x_move <= 1 - elapsed:
+                self.reset_ball()
+                if goal_x > 0:
+                    self.l_score += 1
+                    return "l"
+                self.r_score += 1
+                return "r"
+            break
+
+        # Detect collision with top or bottom wall
+        self.ball_x = x + self.x_move * (1 - elapsed)
+        self.ball_y, direction = fold(self.ball_y + self.y_move, WALL_Y)
+        self.y_move *= direction
+        return None
@@ -1,8 +1,29 @@
 from turtle import Screen
+from engine import PongEngine
 from paddle import Paddle
 from ball import Ball
+import argparse
+import atexit
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from game_common.loop import GameLoop
+from game_common.replay import Recorder, Replay
 from scoreboard import Scoreboard
-import time
+
+KEYS = {"Up": "r_paddle_up", "Down": "r_paddle_down", "w": "l_paddle_up", "s": "l_paddle_down"}
+
+parser = argparse.ArgumentParser(description="Play Pong, or play a recorded game back without a window.")
+parser.add_argument("--record", metavar="PATH", help="save a replay of the game to PATH when it is closed")
+parser.add_argument("--replay", metavar="PATH", help="play a replay back at full speed and print how it ended")
+args = parser.parse_args()
+
+if args.replay:
+    replay = Replay.load(args.replay, "pong")
+    engine = replay.play(PongEngine(), KEYS)
+    print(f"Ticks: {replay.ticks}, score: {engine.l_score} - {engine.r_score}, ball: {engine.ball}, "
+          f"paddles: {engine.l_paddle_y} / {engine.r_paddle_y}")
+    sys.exit()
 
 screen = Screen()
 screen.title("Pong")
@@ -10,39 +31,35 @@ screen.bgcolor("black")
 screen.setup(width=800, height=600)
 screen.tracer(0)
 
-r_paddle = Paddle((350, 0))
-l_paddle = Paddle((-350, 0))
+engine = PongEngine()
+recorder = Recorder("pong", KEYS, engine)
+if args.record:
+    atexit.register(recorder.save, args.record)
+r_paddle = Paddle(engine.r_paddle)
+l_paddle = Paddle(engine.l_paddle)
 ball = Ball()
-scoreboard = Scoreboard()
+scoreboard = Scoreboard(screen)
 
 screen.listen()
-screen.onkeypress(r_paddle.move_paddle_up, "Up")
-screen.onkeypress(r_paddle.move_paddle_down, "Down")
-screen.onkeypress(l_paddle.move_paddle_up, "w")
-screen.onkeypress(l_paddle.move_paddle_down, "s")
-
-game_is_on = True
-while game_is_on:
-    time.sleep(ball.move_speed)
-    screen.update()
-    ball.move()
-
-    # Detect collision with top or bottom wall
-    if ball.ycor() > 280 or ball.ycor() < -280:
-        ball.bounce_y()
-
-    # Detect collision with right paddle or left paddle
-    if ball.distance(r_paddle) < 50 and ball.xcor() > 320 or ball.distance(l_paddle) < 50 and ball.xcor() < -320:
-        ball.bounce_x()
-
-    # Detect if right paddle misses
-    if ball.xcor() > 380:
-        ball.reset_position()
-        scoreboard.l_point()
+recorder.bind(screen.onkeypress)
+
 
-    # Detect if left paddle misses
-    if ball.xcor() < -380:
-        ball.reset_position()
+def tick():
+    scored = recorder.step()
+
+    if scored == "l":
+        scoreboard.l_point()
+    elif scored == "r":
         scoreboard.r_point()
 
-screen.exitonclick()
+
+def render():
+    ball.render(engine.ball)
+    r_paddle.render(engine.r_paddle)
+    l_paddle.render(engine.l_paddle)
+    scoreboard.render()
+
+
+# The ball speeds up by shortening the tick, move_speed is read again before every tick
+GameLoop(screen, tick, render, lambda: engine.move_speed).start()
+screen.mainloop()
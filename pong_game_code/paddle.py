@@ -11,10 +11,6 @@ class Paddle(Turtle):
         self.penup()
         self.goto(position)
 
-    def move_paddle_up(self):
-        new_y = self.ycor() + 20
-        self.goto(self.xcor(), new_y)
-
-    def move_paddle_down(self):
-        new_y = self.ycor() - 20
-        self.goto(self.xcor(), new_y)
+    def render(self, position):
+        if position != self.position():
+            self.goto(position)
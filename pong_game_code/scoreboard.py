@@ -1,23 +1,24 @@
-from turtle import Turtle
+from game_common.text import CanvasText
+FONT = ("Courier", 80, "normal")
 
 
-class Scoreboard(Turtle):
+class Scoreboard:
 
-    def __init__(self):
-        super().__init__()
-        self.color("white")
-        self.penup()
-        self.hideturtle()
+    def __init__(self, screen):
         self.l_score = 0
         self.r_score = 0
+        self.l_text = CanvasText(screen, (-100, 200), align="center", font=FONT, color="white")
+        self.r_text = CanvasText(screen, (100, 200), align="center", font=FONT, color="white")
         self.update_scoreboard()
 
     def update_scoreboard(self):
-        self.clear()
-        self.goto(-100, 200)
-        self.write(self.l_score, align="center", font=("Courier", 80, "normal"))
-        self.goto(100, 200)
-        self.write(self.r_score, align="center", font=("Courier", 80, "normal"))
+        # Only marks the changed score, render() draws it once per frame
+        self.l_text.set(self.l_score)
+        self.r_text.set(self.r_score)
+
+    def render(self):
+        self.l_text.render()
+        self.r_text.render()
 
     def l_point(self):
         self.l_score += 1
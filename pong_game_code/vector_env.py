@@ -0,0 +1,128 @@
+from engine import BALL_MOVE, GOAL_X, PADDLE_FACE_X, PADDLE_MOVE, PADDLE_REACH, SPEED_UP, START_SPEED, WALL_Y
+import time
+import numpy as np
+
+
+def fold(positions, limit):
+    # engine.fold() for arrays
+    offsets = (positions + limit) % (4 * limit)
+    forward = offsets <= 2 * limit
+    return np.where(forward, offsets - limit, 3 * limit - offsets), np.where(forward, 1, -1)
+
+
+def idle(env, side):
+    return np.zeros(env.n, dtype=np.int8)
+
+
+def random_moves(env, side):
+    return env.rng.integers(-1, 2, size=env.n, dtype=np.int8)
+
+
+def follow_ball(env, side):
+    # Moves towards the ball's height whenever it is more than half a move away
+    gap = env.ball_y - env.paddle_y(side)
+    return (np.sign(gap) * (np.abs(gap) > PADDLE_MOVE / 2)).astype(np.int8)
+
+
+class VectorPongEnv:
+    """
+    Many Pong matches stepped together as NumPy arrays.
+
+    Every match follows the rules of PongEngine, including the swept paddle
+    and wall collisions, in one vectorized step() for the whole batch. The
+    paddles are driven by policies: functions taking the env and a side,
+    'l' or 'r', and returning one move per match, -1 for down, 1 for up or
+    0 to stay. idle, random_moves and follow_ball are examples.
+    """
+
+    def __init__(self, n, seed=None):
+        self.n = n
+        self.rng = np.random.default_rng(seed)
+        self.ball_x = np.zeros(n)
+        self.ball_y = np.zeros(n)
+        self.x_move = np.full(n, float(BALL_MOVE))
+        self.y_move = np.full(n, float(BALL_MOVE))
+        self.move_speed = np.full(n, START_SPEED)
+        self.r_paddle_y = np.zeros(n)
+        self.l_paddle_y = np.zeros(n)
+        self.l_scores = np.zeros(n, dtype=np.int64)
+        self.r_scores = np.zeros(n, dtype=np.int64)
+        self.rallies = np.zeros(n, dtype=np.int64)  # Paddle hits so far
+
+    def paddle_y(self, side):
+        return self.l_paddle_y if side == "l" else self.r_paddle_y
+
+    def step(self, l_moves, r_moves):
+        """
+        Moves the paddles, then the balls, by one tick in every match.
+        Args:
+            l_moves (numpy.ndarray): One move per match for the left paddle, -1, 0 or 1.
+            r_moves (numpy.ndarray): The same for the right paddle.
+        Returns:
+            tuple: Boolean arrays (l_scored, r_scored). Those balls are already back in the middle.
+        """
+        self.l_paddle_y += PADDLE_MOVE * np.asarray(l_moves)
+        self.r_paddle_y += PADDLE_MOVE * np.asarray(r_moves)
+
+        # Same sweep as PongEngine.step(), repeated while any ball hits another paddle within the tick
+        x = self.ball_x.copy()
+        elapsed = np.zeros(self.n)
+        while True:
+            right = self.x_move > 0
+            face_x = np.where(right, PADDLE_FACE_X, -PADDLE_FACE_X)
+            paddle_y = np.where(right, self.r_paddle_y, self.l_paddle_y)
+            time_to_face = (face_x - x) / self.x_move
+            y, _ = fold(self.ball_y + self.y_move * (elapsed + time_to_face), WALL_Y)
+            hit = (time_to_face >= 0) & (time_to_face <= 1 - elapsed) & (np.abs(y - paddle_y) <= PADDLE_REACH)
+            if not hit.any():
+                break
+            elapsed[hit] += time_to_face[hit]
+            x[hit] = face_x[hit]
+            self.x_move[hit] *= -1
+            self.move_speed[hit] *= SPEED_UP
+            self.rallies += hit
+
+        right = self.x_move > 0
+        goal_x = np.where(right, GOAL_X, -GOAL_X)
+        scored = (goal_x - x) / self.x_move <= 1 - elapsed
+        l_scored = scored & right
+        r_scored = scored & ~right
+        self.l_scores += l_scored
+        self.r_scores += r_scored
+
+        self.ball_x = x + self.x_move * (1 - elapsed)
+        self.ball_y, directions = fold(self.ball_y + self.y_move, WALL_Y)
+        self.y_move *= np.where(scored, 1, directions)
+
+        # PongEngine.reset_ball(), which also bounces the ball back towards the side that scored
+        self.ball_x[scored] = 0
+        self.ball_y[scored] = 0
+        self.move_speed[scored] = START_SPEED * SPEED_UP
+        self.x_move[scored] *= -1
+        return l_scored, r_scored
+
+    def play(self, left, right, ticks):
+        for _ in range(ticks):
+            self.step(left(self, "l"), right(self, "r"))
+
+
+def benchmark(n=10_000, ticks=1_000):
+    """
+    Times batches of matches between some pairs of policies and prints how many rallies they get through.
+    Args:
+        n (int): The number of matches in a batch.
+        ticks (int): The number of ticks each batch runs for.
+    """
+    for left, right in ((idle, idle), (follow_ball, random_moves), (follow_ball, follow_ball)):
+        env = VectorPongEnv(n, seed=0)
+        start = time.perf_counter()
+        env.play(left, right, ticks)
+        seconds = time.perf_counter() - start
+        print(f"{left.__name__} vs {right.__name__}: {env.rallies.sum()} rallies, "
+              f"{env.l_scores.sum()} - {env.r_scores.sum()} points, "
+              f"{env.rallies.sum() / seconds * 60:,.0f} rallies per minute, "
+              f"{n * ticks / seconds:,.0f} ticks per second")
+
+
+if __name__ == "__main__":
+    benchmark()
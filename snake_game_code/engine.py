@@ -0,0 +1,188 @@
+from collections import deque
+import random
+STARTING_POSITIONS = [(0, 0), (-20, 0), (-40, 0)]
+MOVE_DISTANCE = 20
+UP = 90
+DOWN = 270
+LEFT = 180
+RIGHT = 0
+WALL = 290
+FOOD_RANGE = 270
+STEPS = {UP: (0, 1), DOWN: (0, -1), LEFT: (-1, 0), RIGHT: (1, 0)}
+GRID_LIMIT = WALL // MOVE_DISTANCE  # The head survives on cells -14 to 14, the next cell out is the wall
+GRID_SIZE = 2 * GRID_LIMIT + 1
+FOOD_LIMIT = FOOD_RANGE // MOVE_DISTANCE  # Food.refresh's range, in whole cells
+FOOD_AREA = bytearray(abs(index % GRID_SIZE - GRID_LIMIT) <= FOOD_LIMIT
+                      and abs(index // GRID_SIZE - GRID_LIMIT) <= FOOD_LIMIT
+                      for index in range(GRID_SIZE * GRID_SIZE))
+
+
+class SnakeEngine:
+    """
+    The rules of the snake game without any drawing.
+
+    step() advances the game by one tick, so bots and tests can run it as
+    fast as Python allows, while main.py only draws whatever state it is
+    left in.
+
+    The body is a deque of grid cells, head first, with an occupancy grid
+    next to it. A move pushes the new head and pops the tail, and running
+    into the tail is a single lookup in the grid, so a tick costs the same
+    however long the snake is. segments gives the body in the screen
+    coordinates the turtles use.
+
+    Food goes on a grid cell, so the head lands exactly on it, and only on a
+    free one. The free cells of the food area are kept in a list with each
+    cell's slot in it, updated as the head and tail move, so placing food is
+    one random pick however much of the board the snake fills.
+    """
+
+    def __init__(self, high_score=0, rng=None):
+        self.rng = rng or random.Random()
+        self.score = 0
+        self.high_score = high_score
+        self.body = deque()
+        self.occupied = bytearray(GRID_SIZE * GRID_SIZE)
+        self.free_cells = []
+        self.free_slots = []
+        self.growth = 0
+        self.hit_tail = False
+        self.heading = RIGHT
+        self.reset_snake()
+        self.food = None
+        self.refresh_food()
+
+    @property
+    def head(self):
+        column, row = self.body[0]
+        return column * MOVE_DISTANCE, row * MOVE_DISTANCE
+
+    @property
+    def segments(self):
+        return [(column * MOVE_DISTANCE, row * MOVE_DISTANCE) for column, row in self.body]
+
+    @staticmethod
+    def cell_index(column, row):
+        return (row + GRID_LIMIT) * GRID_SIZE + column + GRID_LIMIT
+
+    def reset_snake(self):
+        self.occupied = bytearray(GRID_SIZE * GRID_SIZE)
+        self.body = deque((x // MOVE_DISTANCE, y // MOVE_DISTANCE) for x, y in STARTING_POSITIONS)
+        for column, row in self.body:
+            self.occupied[self.cell_index(column, row)] = 1
+        self.growth = 0
+        self.heading = RIGHT
+
+        self.free_cells = [index for index, in_area in enumerate(FOOD_AREA)
+                           if in_area and not self.occupied[index]]
+        self.free_slots = [-1] * len(FOOD_AREA)
+        for slot, index in enumerate(self.free_cells):
+            self.free_slots[index] = slot
+
+    def take_cell(self, index):
+        # Removes a cell from the free list by moving the last free cell into its slot
+        slot = self.free_slots[index]
+        if slot < 0:
+            return
+        last = self.free_cells.pop()
+        if last != index:
+            self.free_cells[slot] = last
+            self.free_slots[last] = slot
+        self.free_slots[index] = -1
+
+    def release_cell(self, index):
+        if FOOD_AREA[index]:
+            self.free_slots[index] = len(self.free_cells)
+            self.free_cells.append(index)
+
+    def reset_score(self):
+        if self.score > self.high_score:
+            self.high_score = self.score
+        self.score = 0
+
+    def refresh_food(self):
+        if not self.free_cells:
+            self.food = None  # The snake covers every cell food can go on
+            return
+        index = self.free_cells[self.rng.randrange(len(self.free_cells))]
+        self.food = ((index % GRID_SIZE - GRID_LIMIT) * MOVE_DISTANCE, (index // GRID_SIZE - GRID_LIMIT) * MOVE_DISTANCE)
+
+    def food_is_covered(self):
+        if self.food is None:
+            return True
+        return self.occupied[self.cell_index(self.food[0] // MOVE_DISTANCE, self.food[1] // MOVE_DISTANCE)] == 1
+
+    def extend(self):
+        # Snake.extend() stacked a copy of the tail on top of it, which is the same as keeping the tail on the next move
+        self.growth += 1
+
+    def move(self):
+        step_column, step_row = STEPS[self.heading]
+        column, row = self.body[0]
+        column += step_column
+        row += step_row
+
+        if self.growth:
+            self.growth -= 1
+        else:
+            tail_column, tail_row = self.body.pop()
+            tail_index = self.cell_index(tail_column, tail_row)
+            self.occupied[tail_index] = 0
+            self.release_cell(tail_index)
+
+        self.body.appendleft((column, row))
+        if -GRID_LIMIT <= column <= GRID_LIMIT and -GRID_LIMIT <= row <= GRID_LIMIT:
+            head_index = self.cell_index(column, row)
+            self.hit_tail = self.occupied[head_index] == 1
+            self.occupied[head_index] = 1
+            self.take_cell(head_index)
+        else:
+            self.hit_tail = False  # Off the grid means the wall, which step() checks first
+
+    def up(self):
+        if self.heading != DOWN:
+            self.heading = UP
+
+    def down(self):
+        if self.heading != UP:
+            self.heading = DOWN
+
+    def left(self):
+        if self.heading != RIGHT:
+            self.heading = LEFT
+
+    def right(self):
+        if self.heading != LEFT:
+            self.heading = RIGHT
+
+    def step(self):
+        """
+        Moves the snake one tick and applies the food, wall and tail rules.
+        Returns:
+            tuple: (ate, crashed) for this tick. A crash has already reset the snake and the score.
+        """
+        self.move()
+        head_x, head_y = self.head
+        ate = crashed = False
+
+        # Detect collision with food
+        if (head_x, head_y) == self.food:
+            self.refresh_food()
+            self.extend()
+            self.score += 1
+            ate = True
+
+        # Detect collision with wall
+        if head_x >= WALL or head_x <= -WALL or head_y >= WALL or head_y <= -WALL:
+            crashed = True
+
+        # Detect collision with tail
+        elif self.hit_tail:
+            crashed = True
+
+        if crashed:
+            self.reset_score()
+            self.reset_snake()
+            if self.food_is_covered():
+                self.refresh_food()
+        return ate, crashed
@@ -1,19 +1,12 @@
-from turtle import Turtle
-import random
+from game_common.sprites import SpriteBatch
+FOOD_SIZE = 10
 
 
-class Food(Turtle):
+class Food:
 
-    def __init__(self):
-        super().__init__()
-        self.shape("circle")
-        self.penup()
-        self.shapesize(stretch_len=0.5, stretch_wid=0.5)
-        self.color("red")
-        self.speed("fastest")
-        self.refresh()
+    def __init__(self, screen):
+        self.sprite = SpriteBatch(screen, FOOD_SIZE, FOOD_SIZE, color="red", shape="oval")
 
-    def refresh(self):
-        random_x = random.randint(-270, 270)
-        random_y = random.randint(-270, 270)
-        self.goto(random_x, random_y)
+    def render(self, position):
+        # The engine picks where the food goes, this only draws it there
+        self.sprite.render([] if position is None else [position])
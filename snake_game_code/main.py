@@ -1,8 +1,32 @@
-from snake import Snake
+from engine import SnakeEngine
 from turtle import Screen
+import argparse
+import atexit
+import os
+import random
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from game_common.loop import GameLoop
+from game_common.replay import Recorder, Replay, new_seed, parse_seed
 from food import Food
 from scoreboard import Scoreboard
-import time
+from snake import Snake
+
+KEYS = {"Up": "up", "Down": "down", "Left": "left", "Right": "right"}
+TICK_LENGTH = 0.1
+
+parser = argparse.ArgumentParser(description="Play Snake, or play a recorded game back without a window.")
+parser.add_argument("--seed", type=parse_seed, help="random seed for the food")
+parser.add_argument("--record", metavar="PATH", help="save a replay of the game to PATH when it is closed")
+parser.add_argument("--replay", metavar="PATH", help="play a replay back at full speed and print how it ended")
+args = parser.parse_args()
+
+if args.replay:
+    replay = Replay.load(args.replay, "snake")
+    engine = replay.play(SnakeEngine(high_score=replay.high_score, rng=random.Random(replay.seed)), KEYS)
+    print(f"Ticks: {replay.ticks}, score: {engine.score}, best: {engine.high_score}, "
+          f"head: {engine.head}, length: {len(engine.body)}, food: {engine.food}")
+    sys.exit()
 
 screen = Screen()
 screen.setup(width=600, height=600)
@@ -10,37 +34,38 @@ screen.bgcolor("black")
 screen.title("Snake Game")
 screen.tracer(0)
 
-snake = Snake()
-food = Food()
-scoreboard = Scoreboard()
+seed = new_seed() if args.seed is None else args.seed
+scoreboard = Scoreboard(screen)
+engine = SnakeEngine(high_score=scoreboard.high_score, rng=random.Random(seed))
+recorder = Recorder("snake", KEYS, engine, seed, scoreboard.high_score)
+atexit.register(scoreboard.save)
+if args.record:
+    atexit.register(recorder.save, args.record)
+snake = Snake(screen)
+food = Food(screen)
+snake.render(engine.segments)
+food.render(engine.food)
 
 screen.listen()
-screen.onkey(snake.up, "Up")
-screen.onkey(snake.down, "Down")
-screen.onkey(snake.left, "Left")
-screen.onkey(snake.right, "Right")
-
-game_is_on = True
-while game_is_on:
-    screen.update()
-    time.sleep(0.1)
-    snake.move()
-
-    # Detect collision with food
-    if snake.head.distance(food) < 15:
-        food.refresh()
-        snake.extend()
+recorder.bind(screen.onkey)
+
+
+def tick():
+    ate, crashed = recorder.step()
+
+    if ate:
+        food.render(engine.food)
         scoreboard.increase_score()
 
-    # Detect collision with wall
-    if snake.head.xcor() >= 290 or snake.head.xcor() <= -290 or snake.head.ycor() >= 290 or snake.head.ycor() <= -290:
+    if crashed:
         scoreboard.reset()
-        snake.reset()
+        food.render(engine.food)
+
+
+def render():
+    snake.render(engine.segments)
+    scoreboard.render()
 
-    # Detect collision with tail
-    for segment in snake.segments[1:]:
-        if snake.head.distance(segment) < 10:
-            scoreboard.reset()
-            snake.reset()
 
-screen.exitonclick()
+GameLoop(screen, tick, render, lambda: TICK_LENGTH).start()
+screen.mainloop()
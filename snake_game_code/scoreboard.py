@@ -1,33 +1,38 @@
-from turtle import Turtle
+from game_common.text import CanvasText
 ALIGNMENT = "center"
 FONT = ("Courier", 14, "normal")
 
 
-class Scoreboard(Turtle):
+class Scoreboard:
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, screen):
         self.score = 0
         with open("data.txt") as file:
             self.high_score = int(file.read())
-        self.color("white")
-        self.penup()
-        self.goto(0, 270)
-        self.hideturtle()
+        self.saved_high_score = self.high_score
+        self.text = CanvasText(screen, (0, 270), align=ALIGNMENT, font=FONT, color="white")
         self.update_scoreboard()
 
     def update_scoreboard(self):
-        self.clear()
-        self.write(f"Score: {self.score} High Score: {self.high_score}", align=ALIGNMENT, font=FONT)
+        # Only marks the text as changed, render() draws it once per frame
+        self.text.set(f"Score: {self.score} High Score: {self.high_score}")
+
+    def render(self):
+        self.text.render()
 
     def reset(self):
         if self.score > self.high_score:
             self.high_score = self.score
-            with open("data.txt", mode="w") as file:
-                file.write(f"{self.high_score}")
         self.score = 0
         self.update_scoreboard()
 
+    def save(self):
+        # Writes the high score once when the game closes instead of on every new record
+        if self.high_score != self.saved_high_score:
+            with open("data.txt", mode="w") as file:
+                file.write(f"{self.high_score}")
+            self.saved_high_score = self.high_score
+
     # def game_over(self):
     #     self.goto(0, 0)
     #     self.write("GAME OVER!", align=ALIGNMENT, font=FONT)
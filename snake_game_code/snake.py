@@ -1,59 +1,12 @@
-from turtle import Turtle
-STARTING_POSITIONS = [(0, 0), (-20, 0), (-40, 0)]
-MOVE_DISTANCE = 20
-UP = 90
-DOWN = 270
-LEFT = 180
-RIGHT = 0
+from game_common.sprites import SpriteBatch
+SEGMENT_SIZE = 20
 
 
 class Snake:
 
-    def __init__(self):
-        self.segments = []
-        self.create_snake()
-        self.head = self.segments[0]
+    def __init__(self, screen):
+        self.segments = SpriteBatch(screen, SEGMENT_SIZE, SEGMENT_SIZE, color="white")
 
-    def create_snake(self):
-        for position in STARTING_POSITIONS:
-            self.add_segment(position)
-
-    def add_segment(self, position):
-        new_segment = Turtle("square")
-        new_segment.color("white")
-        new_segment.penup()
-        new_segment.goto(position)
-        self.segments.append(new_segment)
-
-    def reset(self):
-        for seg in self.segments:
-            seg.goto(1000, 1000)
-        self.segments.clear()
-        self.create_snake()
-        self.head = self.segments[0]
-
-    def extend(self):
-        self.add_segment(self.segments[-1].position())
-
-    def move(self):
-        for seg_num in range(len(self.segments) - 1, 0, -1):
-            new_x = self.segments[seg_num - 1].xcor()
-            new_y = self.segments[seg_num - 1].ycor()
-            self.segments[seg_num].goto(new_x, new_y)
-        self.head.forward(MOVE_DISTANCE)
-
-    def up(self):
-        if self.head.heading() != DOWN:
-            self.head.setheading(UP)
-
-    def down(self):
-        if self.head.heading() != UP:
-            self.head.setheading(DOWN)
-
-    def left(self):
-        if self.head.heading() != RIGHT:
-            self.head.setheading(LEFT)
-
-    def right(self):
-        if self.head.heading() != LEFT:
-            self.head.setheading(RIGHT)
+    def render(self, positions):
+        # Draws the segment positions of a SnakeEngine, one canvas square each
+        self.segments.render(positions)
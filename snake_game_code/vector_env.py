@@ -0,0 +1,154 @@
+from engine import DOWN, FOOD_AREA, GRID_LIMIT, GRID_SIZE, LEFT, MOVE_DISTANCE, RIGHT, STARTING_POSITIONS, UP
+import numpy as np
+ACTIONS = [UP, DOWN, LEFT, RIGHT]  # Action i turns the snake towards ACTIONS[i], -1 keeps the heading
+OPPOSITE = np.array([1, 0, 3, 2], dtype=np.int8)
+STEP_COLUMNS = np.array([0, 0, -1, 1], dtype=np.int16)
+STEP_ROWS = np.array([1, -1, 0, 0], dtype=np.int16)
+CELLS = GRID_SIZE * GRID_SIZE
+CAPACITY = CELLS + 1  # Ring buffer slots, enough for a snake covering the whole grid
+FOOD_CELLS = np.flatnonzero(np.frombuffer(FOOD_AREA, dtype=np.uint8)).astype(np.int16)
+IN_FOOD_AREA = np.frombuffer(FOOD_AREA, dtype=np.uint8).astype(np.bool_)
+
+
+class VectorSnakeEnv:
+    """
+    Many snake games stepped together as NumPy arrays.
+
+    Every game follows the rules of SnakeEngine: the snake turns like
+    Snake.up/down/left/right, dies on the wall or its own tail, grows by one
+    for every food and starts over like Snake.reset and Scoreboard.reset, all
+    in one vectorized step() for the whole batch. Bodies are ring buffers of
+    cell indexes, head at head_slots, with one occupancy grid per game.
+
+    Food sits on grid cells, inside the range Food.refresh used, and is only
+    placed on free cells. Like SnakeEngine, every game keeps the free cells
+    of its food area in a row of free_cells, free_counts long, with each
+    cell's slot in free_slots. Moves update them with a vectorized swap
+    remove, so placing food is one random pick per game however full the
+    boards are.
+    """
+
+    def __init__(self, n, seed=None):
+        self.n = n
+        self.rng = np.random.default_rng(seed)
+        self.games = np.arange(n)
+        self.body = np.zeros((n, CAPACITY), dtype=np.int16)
+        self.head_slots = np.zeros(n, dtype=np.int32)
+        self.lengths = np.zeros(n, dtype=np.int32)
+        self.growth = np.zeros(n, dtype=np.int32)
+        self.headings = np.zeros(n, dtype=np.int8)
+        self.head_columns = np.zeros(n, dtype=np.int16)
+        self.head_rows = np.zeros(n, dtype=np.int16)
+        self.occupied = np.zeros((n, CELLS), dtype=np.bool_)
+        self.food = np.zeros(n, dtype=np.int16)  # -1 when a snake covers every cell food can go on
+        self.free_cells = np.zeros((n, FOOD_CELLS.size), dtype=np.int16)
+        self.free_counts = np.zeros(n, dtype=np.int32)
+        self.free_slots = np.full((n, CELLS), -1, dtype=np.int32)
+        self.scores = np.zeros(n, dtype=np.int32)
+        self.high_scores = np.zeros(n, dtype=np.int32)
+        self.reset_snakes(self.games)
+        self.place_food(self.games)
+
+    @staticmethod
+    def cell_index(columns, rows):
+        return (rows + GRID_LIMIT) * GRID_SIZE + columns + GRID_LIMIT
+
+    def reset_snakes(self, games):
+        start = [self.cell_index(x // MOVE_DISTANCE, y // MOVE_DISTANCE) for x, y in reversed(STARTING_POSITIONS)]
+        self.occupied[games] = False
+        self.body[games, :len(start)] = start
+        self.occupied[games[:, None], np.array(start)] = True
+        self.head_slots[games] = len(start) - 1
+        self.lengths[games] = len(start)
+        self.growth[games] = 0
+        self.headings[games] = ACTIONS.index(RIGHT)
+        self.head_columns[games] = STARTING_POSITIONS[0][0] // MOVE_DISTANCE
+        self.head_rows[games] = STARTING_POSITIONS[0][1] // MOVE_DISTANCE
+
+        free = FOOD_CELLS[~np.isin(FOOD_CELLS, start)]
+        self.free_cells[games, :free.size] = free
+        self.free_counts[games] = free.size
+        self.free_slots[games] = -1
+        self.free_slots[games[:, None], free] = np.arange(free.size)
+
+    def take_cells(self, games, cells):
+        # SnakeEngine.take_cell() for one cell per game: the last free cell moves into the taken cell's slot
+        slots = self.free_slots[games, cells]
+        taken = slots >= 0
+        games, cells, slots = games[taken], cells[taken], slots[taken]
+        self.free_counts[games] -= 1
+        last = self.free_cells[games, self.free_counts[games]]
+        self.free_cells[games, slots] = last
+        self.free_slots[games, last] = slots
+        self.free_slots[games, cells] = -1
+
+    def release_cells(self, games, cells):
+        # SnakeEngine.release_cell() for one cell per game
+        released = IN_FOOD_AREA[cells]
+        games, cells = games[released], cells[released]
+        self.free_slots[games, cells] = self.free_counts[games]
+        self.free_cells[games, self.free_counts[games]] = cells
+        self.free_counts[games] += 1
+
+    def place_food(self, games):
+        counts = self.free_counts[games]
+        picks = (self.rng.random(games.size) * counts).astype(np.int32)
+        self.food[games] = np.where(counts > 0, self.free_cells[games, np.minimum(picks, FOOD_CELLS.size - 1)], -1)
+
+    def step(self, actions):
+        """
+        Advances every game by one tick.
+        Args:
+            actions (numpy.ndarray): One action per game, an index into ACTIONS or -1 to keep going straight.
+        Returns:
+            tuple: Boolean arrays (ate, crashed). Crashed games have already been reset.
+        """
+        actions = np.asarray(actions)
+        turning = (actions >= 0) & (OPPOSITE[actions] != self.headings)
+        self.headings = np.where(turning, actions, self.headings).astype(np.int8)
+
+        self.head_columns += STEP_COLUMNS[self.headings]
+        self.head_rows += STEP_ROWS[self.headings]
+        on_grid = (np.abs(self.head_columns) <= GRID_LIMIT) & (np.abs(self.head_rows) <= GRID_LIMIT)
+        heads = np.where(on_grid, self.cell_index(self.head_columns, self.head_rows), 0)
+
+        # Growing snakes keep their tail, the rest free the cell it was on
+        growing = self.growth > 0
+        self.growth -= growing
+        moving = self.games[~growing]
+        tail_slots = (self.head_slots[moving] - self.lengths[moving] + 1) % CAPACITY
+        tails = self.body[moving, tail_slots]
+        self.occupied[moving, tails] = False
+        self.release_cells(moving, tails)
+        self.lengths += growing
+
+        hit_tail = on_grid & self.occupied[self.games, heads]
+        self.head_slots = (self.head_slots + 1) % CAPACITY
+        self.body[self.games, self.head_slots] = heads
+        self.occupied[self.games[on_grid], heads[on_grid]] = True
+        self.take_cells(self.games[on_grid], heads[on_grid])
+
+        ate = on_grid & (heads == self.food)
+        self.scores += ate
+        self.growth += ate
+
+        crashed = ~on_grid | hit_tail
+        if crashed.any():
+            games = self.games[crashed]
+            self.high_scores[games] = np.maximum(self.high_scores[games], self.scores[games])
+            self.scores[games] = 0
+            self.reset_snakes(games)
+            covered = (self.food < 0) | self.occupied[self.games, np.maximum(self.food, 0)]
+            ate_or_covered = ate | crashed & covered
+        else:
+            ate_or_covered = ate
+        if ate_or_covered.any():
+            self.place_food(self.games[ate_or_covered])
+        return ate, crashed
+
+    def segments(self, game):
+        # Screen positions of one game's snake, head first, for drawing or comparing with SnakeEngine
+        slots = (self.head_slots[game] - np.arange(self.lengths[game])) % CAPACITY
+        cells = self.body[game, slots]
+        return [(int(cell % GRID_SIZE - GRID_LIMIT) * MOVE_DISTANCE, int(cell // GRID_SIZE - GRID_LIMIT) * MOVE_DISTANCE)
+                for cell in cells]
@@ -0,0 +1,202 @@
+from contextlib import redirect_stdout
+from task import Task, normalize_date, parse_due_date
+import argparse, csv, json, sys
+
+EXPORT_FIELDS = ["id", "description", "category", "status", "date"]
+TEXT_FIELDS = ["description", "category", "status", "date"]
+
+
+def build_parser(default_file, default_page_size):
+    """
+    Builds the command line parser. Without a subcommand the interactive menus are used.
+    Args:
+        default_file (str): The tasks file used when --file is not given.
+        default_page_size (int): The page size used when --page-size is not given.
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(prog="todo", description="School to-do list.")
+    parser.add_argument("--file", default=default_file,
+                        help="tasks file to use (default: %(default)s)")
+    parser.add_argument("--backend", choices=["json", "sqlite"], default="json",
+                        help="keep tasks in the JSON file or in a SQLite database next to it, "
+                             "migrating the JSON file on first use (default: %(default)s)")
+    parser.add_argument("--page-size", type=int, default=default_page_size,
+                        help="number of tasks shown per page (default: %(default)s)")
+    commands = parser.add_subparsers(dest="command")
+
+    add = commands.add_parser("add", help="add a task")
+    add.add_argument("description")
+    add.add_argument("--category", default="")
+    add.add_argument("--status", default="")
+    add.add_argument("--date", required=True, help="due date as MM/DD/YY HH:MM")
+
+    remove = commands.add_parser("rm", help="remove tasks by id")
+    remove.add_argument("task_ids", nargs="+", metavar="id")
+
+    listing = commands.add_parser("ls", help="list tasks in due date order")
+    listing.add_argument("--status")
+    listing.add_argument("--category")
+    listing.add_argument("--text", help="only tasks whose description contains all of these words")
+    listing.add_argument("--after", help="only tasks due at or after MM/DD/YY HH:MM")
+    listing.add_argument("--before", help="only tasks due before MM/DD/YY HH:MM")
+
+    importing = commands.add_parser("import", help="add tasks from a .jsonl or .csv file")
+    importing.add_argument("path")
+
+    export = commands.add_parser("export", help="write every task as JSON lines or CSV")
+    export.add_argument("path", nargs="?", help="output file (default: standard output)")
+    export.add_argument("--format", choices=["jsonl", "csv"],
+                        help="output format (default: taken from the file extension, else jsonl)")
+
+    return parser
+
+
+def save(tasks, path):
+    # Status messages go to stderr in command mode, so stdout only carries the command's output
+    with redirect_stdout(sys.stderr):
+        tasks.save_tasks(path)
+
+
+def run_command(tasks, args):
+    """
+    Runs one subcommand against a loaded ToDoList.
+    Args:
+        tasks (ToDoList): The loaded to-do list.
+        args (argparse.Namespace): The parsed arguments.
+    Returns:
+        int: The process exit status.
+    """
+    if args.command == "add":
+        return add_command(tasks, args)
+    elif args.command == "rm":
+        return remove_command(tasks, args)
+    elif args.command == "ls":
+        return list_command(tasks, args)
+    elif args.command == "import":
+        return import_command(tasks, args)
+    elif args.command == "export":
+        return export_command(tasks, args)
+    return 1
+
+
+def add_command(tasks, args):
+    new_task = Task(args.description, args.category, args.status, normalize_date(args.date))
+    error = tasks.validate_task(new_task)
+    if error:
+        print(f"Error: {error} Task is not valid.", file=sys.stderr)
+        return 1
+
+    print(tasks.add_task_to_dict(new_task))
+    save(tasks, args.file)
+    return 0
+
+
+def remove_command(tasks, args):
+    missing = [task_id for task_id in args.task_ids if not tasks.remove_task_by_id(task_id)]
+    for task_id in missing:
+        print(f"Error: Task with id {task_id} does not exist.", file=sys.stderr)
+
+    save(tasks, args.file)
+    return 1 if missing else 0
+
+
+def list_command(tasks, args):
+    bounds = {}
+    for option in ("after", "before"):
+        date = getattr(args, option)
+        if date is not None:
+            bounds[option] = parse_due_date(normalize_date(date))
+            if bounds[option] is None:
+                print(f"Error: Invalid date format for --{option}.", file=sys.stderr)
+                return 1
+
+    matches = tasks.query(status=args.status, category=args.category, text=args.text, **bounds)
+    tasks.renderer.render(tasks.table_row(task_id, task) for task_id, task in matches)
+    return 0
+
+
+def read_records(path):
+    """
+    Yields (line number, record) pairs from a .jsonl or .csv file.
+    CSV files need a header row naming the description, category, status and date columns.
+    Args:
+        path (str): The file to read.
+    """
+    with open(path, 'r', newline='') as import_file:
+        if path.lower().endswith(".csv"):
+            # Line 1 is the header
+            for line_number, row in enumerate(csv.DictReader(import_file), start=2):
+                yield line_number, row
+        else:
+            for line_number, line in enumerate(import_file, start=1):
+                if line.strip():
+                    yield line_number, json.loads(line)
+
+
+def record_error(record):
+    """
+    Checks that an imported record has the shape of a task before a Task is built from it.
+    Args:
+        record: One parsed line of the import file.
+    Returns:
+        str: The reason the record cannot be imported, or None if it can.
+    """
+    if not isinstance(record, dict):
+        return "Record is not an object."
+    for field in TEXT_FIELDS:
+        # A missing CSV column comes back as None, which counts as a missing key
+        if record.get(field) is not None and not isinstance(record[field], str):
+            return f"'{field}' is not a string."
+    return None
+
+
+def import_command(tasks, args):
+    new_tasks = []
+    rejected = 0
+    try:
+        for line_number, record in read_records(args.path):
+            # Every record is checked in full here, so add_tasks never fails halfway through the file
+            error = record_error(record)
+            if not error:
+                date = record.get("date")
+                new_task = Task(record.get("description") or "", record.get("category") or "",
+                                record.get("status") or "", normalize_date(date) if date else None)
+                error = tasks.validate_task(new_task)
+            if error:
+                print(f"Error: {args.path}:{line_number}: {error} Skipping task.", file=sys.stderr)
+                rejected += 1
+                continue
+            # Ids are strings everywhere else, so a JSON number id must not be kept as an int key
+            task_id = record.get("id")
+            new_tasks.append((str(task_id) if task_id not in (None, "") else None, new_task))
+    except (OSError, ValueError) as err:
+        print(f"Error: Could not import '{args.path}'. {err}", file=sys.stderr)
+        return 1
+
+    # Everything goes in with a single save, however many records the file held
+    tasks.add_tasks(new_tasks)
+    save(tasks, args.file)
+    print(f"Imported {len(new_tasks)} tasks, skipped {rejected}.", file=sys.stderr)
+    return 0
+
+
+def export_command(tasks, args):
+    export_format = args.format
+    if export_format is None:
+        export_format = "csv" if args.path and args.path.lower().endswith(".csv") else "jsonl"
+
+    out = open(args.path, 'w', newline='') if args.path else sys.stdout
+    try:
+        if export_format == "csv":
+            writer = csv.writer(out)
+            writer.writerow(EXPORT_FIELDS)
+            for task_id, task in tasks.iter_tasks():
+                writer.writerow([task_id, task.description, task.category, task.status, task.date])
+        else:
+            for task_id, task in tasks.iter_tasks():
+                out.write(json.dumps({"id": task_id, **task.to_dict()}) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
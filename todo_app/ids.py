@@ -0,0 +1,44 @@
+from math import gcd
+import random, string
+
+ID_ALPHABET = string.ascii_uppercase + string.digits
+ID_SPACE = len(ID_ALPHABET) ** 6
+PAIR_SPACE = len(ID_ALPHABET) ** 2
+PAIRS = [first + second for first in ID_ALPHABET for second in ID_ALPHABET]
+
+
+class IdAllocator:
+    """
+    Hands out six character task ids in constant time.
+
+    Ids come from walking the whole id space in a random order: the n-th id is
+    (multiplier * n + offset) mod 36^6, which visits every id exactly once as
+    long as the multiplier shares no factor with 36. Ids that are already
+    taken, such as random ids loaded from older files, are simply skipped.
+    """
+
+    def __init__(self, rng=None):
+        rng = rng or random.Random()
+        self.multiplier = rng.randrange(1, ID_SPACE)
+        while gcd(self.multiplier, ID_SPACE) != 1:
+            self.multiplier = rng.randrange(1, ID_SPACE)
+        self.offset = rng.randrange(ID_SPACE)
+        self.counter = 0
+
+    def allocate(self, taken):
+        """
+        Returns the next id that is not in use.
+        Args:
+            taken (dict): The tasks dictionary, or any container of ids in use.
+        Returns:
+            str: A six character id made of uppercase letters and digits.
+        """
+        while self.counter < ID_SPACE:
+            value = (self.multiplier * self.counter + self.offset) % ID_SPACE
+            self.counter += 1
+            task_id = (PAIRS[value // (PAIR_SPACE * PAIR_SPACE)]
+                       + PAIRS[value // PAIR_SPACE % PAIR_SPACE]
+                       + PAIRS[value % PAIR_SPACE])
+            if task_id not in taken:
+                return task_id
+        raise RuntimeError("Every task id is in use.")
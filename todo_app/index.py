@@ -0,0 +1,112 @@
+import bisect, re
+
+UNDATED = float("inf")  # Tasks without a valid due date sort after every dated task
+TOKEN_PATTERN = re.compile(r"\w+")
+NO_IDS = frozenset()
+
+
+def tokenize(text):
+    """
+    Splits text into the lowercase words used by the description index.
+    Args:
+        text (str): The text to split.
+    Returns:
+        set: The distinct words.
+    """
+    return set(TOKEN_PATTERN.findall(text.lower())) if text else set()
+
+
+class DueDateIndex:
+    """
+    Task ids kept in due date order.
+
+    Entries are (due, task_id) pairs in a sorted list, so walking the index
+    is already in display order and every overdue task sits in one prefix.
+    """
+
+    def __init__(self, entries=()):
+        self.entries = sorted((UNDATED if due is None else due, task_id) for task_id, due in entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return (task_id for _, task_id in self.entries)
+
+    def slice(self, start, stop):
+        return [task_id for _, task_id in self.entries[start:stop]]
+
+    def add(self, task_id, due):
+        bisect.insort(self.entries, (UNDATED if due is None else due, task_id))
+
+    def add_many(self, entries):
+        if entries:
+            # Timsort merges the already sorted list with the new run in close to linear time
+            self.entries.extend((UNDATED if due is None else due, task_id) for task_id, due in entries)
+            self.entries.sort()
+
+    def remove(self, task_id, due):
+        entry = (UNDATED if due is None else due, task_id)
+        position = bisect.bisect_left(self.entries, entry)
+        if position < len(self.entries) and self.entries[position] == entry:
+            del self.entries[position]
+
+    def range(self, after=None, before=None):
+        """
+        Returns the tasks due in [after, before), earliest first.
+        Tasks without a due date only match when neither bound is given.
+        Args:
+            after (int): The inclusive lower bound in epoch seconds.
+            before (int): The exclusive upper bound in epoch seconds.
+        Returns:
+            list: The matching task ids.
+        """
+        start = 0 if after is None else bisect.bisect_left(self.entries, (after,))
+        if before is not None:
+            stop = bisect.bisect_left(self.entries, (before,))
+        elif after is not None:
+            stop = bisect.bisect_left(self.entries, (UNDATED,))
+        else:
+            stop = len(self.entries)
+        return [task_id for _, task_id in self.entries[start:stop]]
+
+    def pop_due_before(self, timestamp):
+        """
+        Removes every task due strictly before the timestamp.
+        Args:
+            timestamp (float): The cut-off in epoch seconds.
+        Returns:
+            list: The ids of the removed tasks, earliest first.
+        """
+        end = bisect.bisect_left(self.entries, (timestamp,))
+        expired = [task_id for _, task_id in self.entries[:end]]
+        del self.entries[:end]
+        return expired
+
+    def undated(self):
+        start = bisect.bisect_left(self.entries, (UNDATED,))
+        return [task_id for _, task_id in self.entries[start:]]
+
+
+class InvertedIndex:
+    """
+    Maps each value of a task field to the set of ids of the tasks that have it.
+    """
+
+    def __init__(self):
+        self.postings = {}
+
+    def add(self, task_id, keys):
+        for key in keys:
+            self.postings.setdefault(key, set()).add(task_id)
+
+    def remove(self, task_id, keys):
+        for key in keys:
+            task_ids = self.postings.get(key)
+            if task_ids is not None:
+                task_ids.discard(task_id)
+                if not task_ids:
+                    del self.postings[key]
+
+    def get(self, key):
+        return self.postings.get(key, NO_IDS)
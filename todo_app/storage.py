@@ -0,0 +1,324 @@
+from index import tokenize
+from task import Task
+import json, os, sqlite3, threading
+
+JOURNAL_SUFFIX = ".journal"
+COMPACTING_SUFFIX = ".journal.compacting"
+SNAPSHOT_TMP_SUFFIX = ".tmp"
+COMPACT_THRESHOLD_BYTES = 1024 * 1024
+
+
+class JournalStorage:
+    """
+    Append-only storage engine for the tasks dictionary.
+
+    The JSON file at file_path is a snapshot of the tasks as of the last
+    compaction. Every save appends one add/update/remove record per changed
+    task to a journal next to it, and loading replays the journal on top of
+    the snapshot. Once the journal grows past the compaction threshold it is
+    folded into a new snapshot on a background thread.
+    """
+
+    def __init__(self, file_path, compact_threshold=COMPACT_THRESHOLD_BYTES):
+        self.file_path = file_path
+        self.journal_path = file_path + JOURNAL_SUFFIX
+        self.compacting_path = file_path + COMPACTING_SUFFIX
+        self.compact_threshold = compact_threshold
+        self.compactor = None
+
+    def load(self):
+        """
+        Loads the snapshot and replays the journal on top of it.
+        Returns:
+            dict: The tasks dictionary.
+        """
+        tasks = self.read_snapshot()
+
+        # This file only survives a compaction that was interrupted before the new snapshot landed
+        interrupted = os.path.exists(self.compacting_path)
+        if interrupted:
+            self.replay(self.compacting_path, tasks)
+        self.replay(self.journal_path, tasks)
+
+        if interrupted:
+            # Replaying is idempotent, so the journal can safely be applied again on top of this snapshot
+            self.write_snapshot(tasks)
+            os.remove(self.compacting_path)
+
+        return tasks
+
+    def read_snapshot(self):
+        try:
+            with open(self.file_path, 'r') as json_file:
+                return json.load(json_file)
+        except FileNotFoundError:
+            print(f"File '{self.file_path}' not found. Creating a new empty dictionary.")
+            with open(self.file_path, 'w') as json_file:
+                json.dump({}, json_file)
+            return {}
+        except json.decoder.JSONDecodeError as e:
+            print(f"JSON file is empty or corrupt. Returning an empty dictionary. {e}")
+            return {}
+
+    def replay(self, journal_path, tasks):
+        """
+        Applies every complete record of a journal to the tasks dictionary.
+        A torn record at the end, left by a crash in the middle of an append,
+        is cut off so that the next append starts on a clean line.
+        Args:
+            journal_path (str): The journal to replay.
+            tasks (dict): The tasks dictionary to update in place.
+        """
+        try:
+            journal = open(journal_path, 'rb')
+        except FileNotFoundError:
+            return
+
+        good_bytes = 0
+        torn = False
+        with journal:
+            for line in journal:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("record is missing its line terminator")
+                    record = json.loads(line)
+                except ValueError:
+                    torn = True
+                    break
+
+                if record["op"] == "remove":
+                    tasks.pop(record["id"], None)
+                else:
+                    tasks[record["id"]] = record["task"]
+                good_bytes += len(line)
+
+        if torn:
+            print(f"Journal '{journal_path}' ends with an incomplete record. Discarding it.")
+            with open(journal_path, 'r+b') as journal:
+                journal.truncate(good_bytes)
+
+    def append(self, changes):
+        """
+        Appends one record per changed task to the journal and syncs it to disk.
+        Args:
+            changes (dict): Maps task ids to (op, task) pairs, where op is 'add',
+                'update' or 'remove' and task is None for removals.
+        """
+        if not changes:
+            return
+
+        records = []
+        for task_id, (op, task) in changes.items():
+            record = {"op": op, "id": task_id}
+            if op != "remove":
+                record["task"] = task
+            records.append(json.dumps(record) + "\n")
+
+        with open(self.journal_path, 'a') as journal:
+            journal.write("".join(records))
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    def needs_compaction(self):
+        if self.compactor is not None and self.compactor.is_alive():
+            return False
+        try:
+            return os.path.getsize(self.journal_path) >= self.compact_threshold
+        except FileNotFoundError:
+            return False
+
+    def compact(self, tasks):
+        """
+        Folds the journal into a new snapshot on a background thread.
+        The journal is moved aside first so that saves made while the snapshot
+        is being written go to a fresh journal.
+        Args:
+            tasks (dict): A private copy of the tasks, matching what has been appended so far.
+        """
+        if os.path.exists(self.compacting_path):
+            # An earlier compaction failed before its snapshot landed, so these records are not in the snapshot
+            # yet. The journal is added after them rather than renamed over them. If that is interrupted, load()
+            # replays the leftover first and then the whole journal, which is still in place.
+            with open(self.journal_path, 'rb') as journal, open(self.compacting_path, 'ab') as compacting:
+                compacting.write(journal.read())
+                compacting.flush()
+                os.fsync(compacting.fileno())
+            os.remove(self.journal_path)
+        else:
+            os.replace(self.journal_path, self.compacting_path)
+        self.compactor = threading.Thread(target=self.finish_compaction, args=(tasks,))
+        self.compactor.start()
+
+    def finish_compaction(self, tasks):
+        self.write_snapshot(tasks)
+        os.remove(self.compacting_path)
+
+    def reset(self, tasks):
+        """
+        Replaces the snapshot with the given tasks and drops any journal.
+        Args:
+            tasks (dict): The tasks dictionary.
+        """
+        if self.compactor is not None:
+            self.compactor.join()
+        self.write_snapshot(tasks)
+        for path in (self.journal_path, self.compacting_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def write_snapshot(self, tasks):
+        # Write to a temporary file and rename it over the snapshot so a crash never leaves a partial file
+        tmp_path = self.file_path + SNAPSHOT_TMP_SUFFIX
+        with open(tmp_path, 'w') as json_file:
+            json.dump(tasks, json_file, indent=4)
+            json_file.flush()
+            os.fsync(json_file.fileno())
+        os.replace(tmp_path, self.file_path)
+
+
+UNDATED_DUE = 2 ** 63 - 1  # Stored as the due date of tasks without a valid one, so they sort last
+TASK_COLUMNS = "id, description, category, status, date, due"
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    description TEXT,
+    category TEXT,
+    status TEXT,
+    date TEXT,
+    due INTEGER NOT NULL,
+    completed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_by_partition ON tasks (completed, due, id);
+CREATE INDEX IF NOT EXISTS tasks_by_due ON tasks (due);
+CREATE INDEX IF NOT EXISTS tasks_by_status ON tasks (status);
+CREATE INDEX IF NOT EXISTS tasks_by_category ON tasks (category);
+CREATE TABLE IF NOT EXISTS task_words (
+    word TEXT NOT NULL,
+    id TEXT NOT NULL,
+    PRIMARY KEY (word, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS task_words_by_id ON task_words (id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class SQLiteStorage:
+    """
+    SQLite storage engine for the to-do list.
+
+    Tasks stay in an indexed table instead of being loaded into memory, so
+    listing, expiry and filtering run as queries. Every write made between
+    two saves shares one transaction, which save commits.
+    """
+
+    def __init__(self, db_path, completed_status):
+        self.db_path = db_path
+        self.completed_status = completed_status
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def migrate(self, json_path):
+        """
+        Copies the tasks of a JSON tasks file into the database, once.
+        Args:
+            json_path (str): The JSON snapshot, replayed together with its journal.
+        """
+        done = self.connection.execute("SELECT value FROM meta WHERE key = 'migrated_from'").fetchone()
+        if done or not os.path.exists(json_path):
+            return
+
+        tasks = JournalStorage(json_path).load()
+        self.insert_many((task_id, Task.from_dict(task)) for task_id, task in tasks.items())
+        self.connection.execute("INSERT INTO meta (key, value) VALUES ('migrated_from', ?)", (json_path,))
+        self.commit()
+        print(f"Migrated {len(tasks)} tasks from '{json_path}' to '{self.db_path}'.")
+
+    def commit(self):
+        self.connection.commit()
+
+    def row_to_task(self, row):
+        task_id, description, category, status, date, due = row
+        return task_id, Task.restore(description, category, status, date, None if due == UNDATED_DUE else due)
+
+    def task_values(self, task_id, task):
+        due = UNDATED_DUE if task.due is None else task.due
+        return (task_id, task.description, task.category, task.status, task.date, due,
+                task.status == self.completed_status)
+
+    def contains(self, task_id):
+        return self.connection.execute("SELECT 1 FROM tasks WHERE id = ?", (task_id,)).fetchone() is not None
+
+    def get(self, task_id):
+        row = self.connection.execute(f"SELECT {TASK_COLUMNS} FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return None if row is None else self.row_to_task(row)[1]
+
+    def count(self, completed=None):
+        if completed is None:
+            return self.connection.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+        return self.connection.execute("SELECT COUNT(*) FROM tasks WHERE completed = ?", (completed,)).fetchone()[0]
+
+    def page(self, completed, start, stop):
+        rows = self.connection.execute(f"SELECT {TASK_COLUMNS} FROM tasks WHERE completed = ? "
+                                       "ORDER BY due, id LIMIT ? OFFSET ?",
+                                       (completed, max(stop - start, 0), start))
+        return [self.row_to_task(row) for row in rows]
+
+    def iter_all(self):
+        return (self.row_to_task(row) for row in self.connection.execute(f"SELECT {TASK_COLUMNS} FROM tasks"))
+
+    def insert_many(self, tasks):
+        tasks = list(tasks)
+        self.connection.executemany("INSERT OR REPLACE INTO tasks "
+                                    "(id, description, category, status, date, due, completed) "
+                                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                    (self.task_values(task_id, task) for task_id, task in tasks))
+        self.connection.executemany("INSERT OR IGNORE INTO task_words (word, id) VALUES (?, ?)",
+                                    ((word, task_id) for task_id, task in tasks
+                                     for word in tokenize(task.description)))
+
+    def update(self, task_id, task):
+        self.connection.execute("DELETE FROM task_words WHERE id = ?", (task_id,))
+        self.insert_many([(task_id, task)])
+
+    def delete(self, task_id):
+        self.connection.execute("DELETE FROM task_words WHERE id = ?", (task_id,))
+        return self.connection.execute("DELETE FROM tasks WHERE id = ?", (task_id,)).rowcount > 0
+
+    def undated(self):
+        return self.connection.execute("SELECT id, date FROM tasks WHERE due = ?", (UNDATED_DUE,)).fetchall()
+
+    def delete_due_before(self, timestamp):
+        self.connection.execute("DELETE FROM task_words WHERE id IN (SELECT id FROM tasks WHERE due < ?)",
+                                (timestamp,))
+        return self.connection.execute("DELETE FROM tasks WHERE due < ?", (timestamp,)).rowcount
+
+    def query(self, status=None, category=None, text=None, after=None, before=None):
+        clauses = []
+        params = []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if category is not None:
+            clauses.append("category = ?")
+            params.append(category)
+        for word in tokenize(text):
+            clauses.append("id IN (SELECT id FROM task_words WHERE word = ?)")
+            params.append(word)
+        if after is not None:
+            clauses.append("due >= ?")
+            params.append(after)
+        if before is not None:
+            clauses.append("due < ?")
+            params.append(before)
+        elif after is not None:
+            clauses.append("due < ?")
+            params.append(UNDATED_DUE)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.connection.execute(f"SELECT {TASK_COLUMNS} FROM tasks{where} ORDER BY completed, due, id", params)
+        return [self.row_to_task(row) for row in rows]
@@ -0,0 +1,44 @@
+import sys
+
+CLEAR_SCREEN = "\033[H\033[2J"  # Cursor home, then erase the display
+COLUMNS = ["Task Description", "Category", "Status", "Due Date", "Task ID"]
+
+
+class TableRenderer:
+    """
+    Writes grid tables in the layout tabulate's "grid" format used.
+
+    Each column is as wide as its longest cell in the rows being rendered,
+    so every cell is shown in full. The list is rendered one page at a
+    time, so only that page's rows are held while the widths are measured.
+    """
+
+    def __init__(self, columns=COLUMNS):
+        self.columns = columns
+
+    @staticmethod
+    def rule(widths, fill):
+        return "+" + "+".join(fill * (width + 2) for width in widths) + "+\n"
+
+    @staticmethod
+    def format_row(cells, widths):
+        return "| " + " | ".join(cell.ljust(width) for cell, width in zip(cells, widths)) + " |\n"
+
+    def render(self, rows, out=None):
+        out = out or sys.stdout
+        rows = [[str(cell) for cell in row] for row in rows]
+        widths = [max([len(name)] + [len(row[i]) for row in rows]) for i, name in enumerate(self.columns)]
+
+        border = self.rule(widths, "-")
+        out.write(border)
+        out.write(self.format_row(self.columns, widths))
+        out.write(self.rule(widths, "="))
+        for row in rows:
+            out.write(self.format_row(row, widths))
+            out.write(border)
+
+
+def clear_screen(out=None):
+    out = out or sys.stdout
+    out.write(CLEAR_SCREEN)
+    out.flush()
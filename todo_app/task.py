@@ -0,0 +1,82 @@
+from datetime import datetime
+from functools import lru_cache
+
+DATE_FORMAT = '%m/%d/%y %H:%M:%S'
+
+
+def normalize_date(date):
+    """
+    Adds the seconds to a due date entered as MM/DD/YY HH:MM.
+    Args:
+        date (str): The due date, with or without seconds.
+    Returns:
+        str: The due date in MM/DD/YY HH:MM:SS format.
+    """
+    date = date.strip()
+    return date + ":00" if date.count(":") == 1 else date
+
+
+@lru_cache(maxsize=4096)
+def parse_due_date(date):
+    """
+    Parses a due date string into a local epoch timestamp.
+    Args:
+        date (str): The due date in MM/DD/YY HH:MM:SS format.
+    Returns:
+        int: The due date in epoch seconds, or None if the date is missing or malformed.
+    """
+    try:
+        return int(datetime.strptime(date, DATE_FORMAT).timestamp())
+    except (TypeError, ValueError):
+        return None
+
+
+class Task:
+    """
+    A single to-do list entry.
+
+    The due date is parsed once, whenever it is set, and kept next to the
+    original string as epoch seconds so that validation, expiry and sorting
+    never have to call strptime again.
+    """
+
+    __slots__ = ("description", "category", "status", "date", "due")
+
+    def __init__(self, description, category, status, date):
+        self.description = description
+        self.category = category
+        self.status = status
+        self.set_date(date)
+
+    def set_date(self, date):
+        self.date = date
+        self.due = parse_due_date(date)
+
+    def copy(self):
+        return Task(self.description, self.category, self.status, self.date)
+
+    @classmethod
+    def restore(cls, description, category, status, date, due):
+        # For storage that already keeps the parsed due date next to the string
+        task = cls.__new__(cls)
+        task.description = description
+        task.category = category
+        task.status = status
+        task.date = date
+        task.due = due
+        return task
+
+    @classmethod
+    def from_dict(cls, task_dict):
+        return cls(task_dict.get("description"), task_dict.get("category"),
+                   task_dict.get("status"), task_dict.get("date"))
+
+    def to_dict(self):
+        task_dict = {
+            "description": self.description,
+            "category": self.category,
+            "status": self.status
+        }
+        if self.date is not None:
+            task_dict["date"] = self.date
+        return task_dict
@@ -1,3 +1,2 @@
 @echo off
-python "C:\Users\cporr\apps\todo_app\todo.py"
-
+python "C:\Users\cporr\apps\todo_app\todo.py" %*
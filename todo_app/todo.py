@@ -1,7 +1,18 @@
-from tabulate import tabulate
 from datetime import datetime
 from os import system as os_sys, name as os_name
-import json, random, string, sys
+from cli import build_parser, run_command
+from contextlib import nullcontext, redirect_stdout
+from ids import IdAllocator
+from index import UNDATED, DueDateIndex, InvertedIndex, tokenize
+from itertools import chain
+from storage import JournalStorage, SQLiteStorage
+from table import TableRenderer, clear_screen
+from task import Task
+import os, sys
+
+COMPLETED = 'Completed'
+DEFAULT_PAGE_SIZE = 20
+
 
 class InputValidation:
 
@@ -14,7 +25,7 @@ class InputValidation:
         Returns:
             int: 0 if the input is valid, 1 otherwise.
         """
-        if isinstance(user_input, str) and (user_input == 'm' or user_input == 'e'):
+        if isinstance(user_input, str) and user_input in ('m', 'n', 'p', 'e'):
             return 0
         else:
             return 1
@@ -54,7 +65,7 @@ class MenuOptions:
         tasks.print_tasks()
         
         try:
-            user_choice = input("Main Menu(m) or Exit(e): ")
+            user_choice = input("Main Menu(m), Next Page(n), Previous Page(p) or Exit(e): ")
             
             if InputValidation.home_menu_validation(user_choice):
                 print("Please enter a valid choice.")
@@ -120,33 +131,148 @@ class MenuOptions:
             return 0
 
 
+def listing_order(pair):
+    task_id, task = pair
+    return task.status == COMPLETED, UNDATED if task.due is None else task.due, task_id
+
+
 class ToDoList:
-    def __init__(self):
+    def __init__(self, page_size=DEFAULT_PAGE_SIZE, index_descriptions=True):
         self.tasks_dict = {}
+        self.page = 0
+        self.page_size = page_size
+        self.renderer = TableRenderer()
+        self.in_progress_index = DueDateIndex()
+        self.completed_index = DueDateIndex()
+        self.status_index = InvertedIndex()
+        self.category_index = InvertedIndex()
+        self.description_index = InvertedIndex() if index_descriptions else None
+        self.id_allocator = IdAllocator()
+        self.storage = None
+        self.changes = {}  # task id -> 'add', 'update' or 'remove' since the last save
 
     def generate_random_id(self):
-        random_id = ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(6))
-        while random_id in self.tasks_dict:
-            random_id = ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(6))
-        return random_id
+        return self.id_allocator.allocate(self)
+
+    def __contains__(self, task_id):
+        return task_id in self.tasks_dict
+
+    def get_task(self, task_id):
+        return self.tasks_dict.get(task_id)
+
+    def task_count(self):
+        return len(self.tasks_dict)
+
+    def count_tasks(self, completed):
+        return len(self.completed_index if completed else self.in_progress_index)
+
+    def page_tasks(self, completed, start, stop):
+        """
+        Returns one slice of a status partition in due date order.
+        Args:
+            completed (bool): Whether to read the completed tasks or the in progress ones.
+            start (int): The position of the first task.
+            stop (int): The position after the last task.
+        Returns:
+            list: (task_id, task) pairs.
+        """
+        index = self.completed_index if completed else self.in_progress_index
+        return [(task_id, self.tasks_dict[task_id]) for task_id in index.slice(start, stop)]
+
+    def iter_tasks(self):
+        return iter(self.tasks_dict.items())
 
     def add_task_to_dict(self, new_task):
-        self.tasks_dict[self.generate_random_id()] = new_task  
+        task_id = self.generate_random_id()
+        self.insert_task(task_id, new_task)
+        self.changes[task_id] = "add"
+        return task_id
+
+    def add_tasks(self, new_tasks):
+        """
+        Adds many tasks at once, sorting each index once instead of inserting one task at a time.
+        Args:
+            new_tasks (list): (task_id, task) pairs. A task id of None, or one that is
+                already taken, is replaced with a generated id.
+        Returns:
+            list: The ids the tasks were stored under.
+        """
+        task_ids = []
+        in_progress = []
+        completed = []
+        for task_id, task in new_tasks:
+            if task_id is None or task_id in self:
+                task_id = self.generate_random_id()
+            self.tasks_dict[task_id] = task
+            self.index_task(task_id, task)
+            self.changes[task_id] = "add"
+            (completed if task.status == COMPLETED else in_progress).append((task_id, task.due))
+            task_ids.append(task_id)
+
+        self.in_progress_index.add_many(in_progress)
+        self.completed_index.add_many(completed)
+        return task_ids
+
+    def index_for(self, task):
+        return self.completed_index if task.status == COMPLETED else self.in_progress_index
+
+    def index_task(self, task_id, task):
+        self.status_index.add(task_id, (task.status,))
+        self.category_index.add(task_id, (task.category,))
+        if self.description_index is not None:
+            self.description_index.add(task_id, tokenize(task.description))
+
+    def unindex_task(self, task_id, task):
+        self.status_index.remove(task_id, (task.status,))
+        self.category_index.remove(task_id, (task.category,))
+        if self.description_index is not None:
+            self.description_index.remove(task_id, tokenize(task.description))
+
+    def insert_task(self, task_id, task):
+        self.tasks_dict[task_id] = task
+        self.index_for(task).add(task_id, task.due)
+        self.index_task(task_id, task)
+
+    def delete_task(self, task_id):
+        task = self.tasks_dict.pop(task_id)
+        self.index_for(task).remove(task_id, task.due)
+        self.unindex_task(task_id, task)
+
+    def replace_task(self, task_id, task):
+        self.delete_task(task_id)
+        self.insert_task(task_id, task)
+        self.mark_updated(task_id)
+
+    def mark_updated(self, task_id):
+        # A task added since the last save still has to be journaled as an add
+        if self.changes.get(task_id) != "add":
+            self.changes[task_id] = "update"
+
+    def mark_removed(self, task_id):
+        self.changes[task_id] = "remove"
+
+    def validate_task(self, task):
+        """
+        Checks that a task has a well-formed due date that has not passed yet.
+        Args:
+            task (Task): The task to check.
+        Returns:
+            str: The reason the task is not valid, or None if it is.
+        """
+        if task.date is None:
+            return "'date' key not found in task dictionary."
+        if task.due is None:
+            return "Invalid date format."
+        if task.due < datetime.now().timestamp():
+            return "Due date has already passed."
+        return None
 
     def is_task_valid(self, task):
-        if 'date' in task:
-            try:
-                due_date = datetime.strptime(task['date'], '%m/%d/%y %H:%M:%S')
-                current_date = datetime.now()
-                if due_date >= current_date:
-                    return True
-                else:
-                    print("Error: Due date has already passed. Task is not valid.")
-            except ValueError:
-                print("Error: Invalid date format. Task is not valid.")
-        else:
-            print("Error: 'date' key not found in task dictionary. Task is not valid.")
-        return False
+        error = self.validate_task(task)
+        if error:
+            print(f"Error: {error} Task is not valid.")
+            return False
+        return True
 
     def new_task(self):
         print("""
@@ -160,139 +286,281 @@ class ToDoList:
         print("Due date format should be MM/DD/YY HH:MM")
         date = input("Task Due Date: ") + ":00"
 
-        new_task = {
-            "description": description,
-            "category": category,
-            "status": status,
-            "date": date
-        }
+        new_task = Task(description, category, status, date)
 
         if self.is_task_valid(new_task):
             self.add_task_to_dict(new_task)
             print("Added task successfully.")
 
     def remove_task(self):
-        if not self.tasks_dict:
+        if not self.task_count():
             print("Tasks list is empty.")
 
         task_id = input("\nEnter the id of the task you want to remove: ")
 
-        if task_id in self.tasks_dict:
-            del self.tasks_dict[task_id]
+        if self.remove_task_by_id(task_id):
             print("Removed task successfully.")
         else:
             print("Task with the provided id does not exist.")
 
+    def remove_task_by_id(self, task_id):
+        if task_id not in self:
+            return False
+        self.delete_task(task_id)
+        self.mark_removed(task_id)
+        return True
+
     def update_task(self):
         task_id = input("\nEnter the id of the task you want to update: ")
 
-        if task_id in self.tasks_dict:
+        task = self.get_task(task_id)
+
+        if task is not None:
             task_to_update = MenuOptions.update_task_menu()
 
             if not task_to_update:
                 return
 
-            new_task = self.tasks_dict[task_id].copy()
+            new_task = task.copy()
 
             if task_to_update == 1:
-                new_task["description"] = input("New Task Description: ")
+                new_task.description = input("New Task Description: ")
             elif task_to_update == 2:
-                new_task["category"] = input("New Task Category: ")
+                new_task.category = input("New Task Category: ")
             elif task_to_update == 3:
-                new_task["status"] = input("New Task Status: ")
+                new_task.status = input("New Task Status: ")
             elif task_to_update == 4:
                 print("Due date format should be MM/DD/YY HH:MM")
-                new_task["date"] = input("New Task Due Date: ") + ":00"
+                new_task.set_date(input("New Task Due Date: ") + ":00")
 
-            self.tasks_dict[task_id] = new_task
+            self.replace_task(task_id, new_task)
 
             print("Task updated successfully.")
         else:
             print("Task with the provided id does not exist.")
 
     def clear_expired_dates(self):
-        current_datetime = datetime.now()
+        current_timestamp = datetime.now().timestamp()
+
+        for index in (self.in_progress_index, self.completed_index):
+            for task_id in index.undated():
+                if self.tasks_dict[task_id].date is None:
+                    print(f"Error: 'date' key not found in task {task_id}. Skipping task.")
+                else:
+                    print(f"Error: Invalid date format in task {task_id}. Skipping task.")
+
+            # Overdue tasks are the front of each index, so only they are touched
+            for task_id in index.pop_due_before(current_timestamp):
+                self.unindex_task(task_id, self.tasks_dict.pop(task_id))
+                self.mark_removed(task_id)
 
-        tasks_to_remove = []
+        print("Expired tasks removed successfully.")
 
+    def load_tasks(self, file_path):
+        self.storage = JournalStorage(file_path)
+        self.changes = {}
+        self.tasks_dict = {task_id: Task.from_dict(task) for task_id, task in self.storage.load().items()}
+        self.in_progress_index = DueDateIndex((task_id, task.due) for task_id, task in self.tasks_dict.items()
+                                              if task.status != COMPLETED)
+        self.completed_index = DueDateIndex((task_id, task.due) for task_id, task in self.tasks_dict.items()
+                                            if task.status == COMPLETED)
+        self.status_index = InvertedIndex()
+        self.category_index = InvertedIndex()
+        if self.description_index is not None:
+            self.description_index = InvertedIndex()
         for task_id, task in self.tasks_dict.items():
-            if 'date' not in task:
-                print(f"Error: 'date' key not found in task {task_id}. Skipping task.")
+            self.index_task(task_id, task)
+
+    def save_tasks(self, file_path):
+        if self.storage is None or self.storage.file_path != file_path:
+            # Nothing was loaded from this file, so it starts from a full snapshot instead of a journal
+            self.storage = JournalStorage(file_path)
+            self.storage.reset(self.serialize_tasks())
+        else:
+            self.storage.append({task_id: (op, None if op == "remove" else self.tasks_dict[task_id].to_dict())
+                                 for task_id, op in self.changes.items()})
+            if self.storage.needs_compaction():
+                self.storage.compact(self.serialize_tasks())
+        self.changes = {}
+        print("Tasks were successfully saved")
+
+    def serialize_tasks(self):
+        return {task_id: task.to_dict() for task_id, task in self.tasks_dict.items()}
+
+    def query(self, status=None, category=None, text=None, after=None, before=None):
+        """
+        Finds matching tasks through the indexes, touching only the ids that can match.
+        Args:
+            status (str): Only tasks with this status.
+            category (str): Only tasks in this category.
+            text (str): Only tasks whose description contains every word of this text.
+            after (int): Only tasks due at or after this epoch timestamp.
+            before (int): Only tasks due before this epoch timestamp.
+        Returns:
+            list: (task_id, task) pairs, in progress tasks first, each group in due date order.
+        """
+        candidates = []
+        if status is not None:
+            candidates.append(self.status_index.get(status))
+        if category is not None:
+            candidates.append(self.category_index.get(category))
+
+        words = tokenize(text)
+        if words and self.description_index is not None:
+            candidates.extend(self.description_index.get(word) for word in words)
+            words = set()
+
+        if not candidates:
+            # Nothing narrows the ids down, so read the date range straight off the due date indexes
+            task_ids = chain(self.in_progress_index.range(after, before), self.completed_index.range(after, before))
+            return [(task_id, self.tasks_dict[task_id]) for task_id in task_ids
+                    if not words or words <= tokenize(self.tasks_dict[task_id].description)]
+
+        # Intersecting from the smallest set keeps the work proportional to the rarest filter
+        candidates.sort(key=len)
+        matches = []
+        for task_id in candidates[0]:
+            if not all(task_id in task_ids for task_ids in candidates[1:]):
+                continue
+            task = self.tasks_dict[task_id]
+            if after is not None or before is not None:
+                if task.due is None or (after is not None and task.due < after) \
+                        or (before is not None and task.due >= before):
+                    continue
+            if words and not words <= tokenize(task.description):
                 continue
+            matches.append((task_id, task))
 
-            try:
-                due_date = datetime.strptime(task['date'], '%m/%d/%y %H:%M:%S')
-                if due_date < current_datetime:
-                    tasks_to_remove.append(task_id)
-            except ValueError:
-                print(f"Error: Invalid date format in task {task_id}. Skipping task.")
+        matches.sort(key=listing_order)
+        return matches
 
-        for task_id in tasks_to_remove:
-            del self.tasks_dict[task_id]
+    def table_row(self, task_id, task):
+        return [task.description, task.category, task.status, task.date, task_id]
 
-        print("Expired tasks removed successfully.")
+    def page_count(self):
+        return max(1, -(-self.task_count() // self.page_size))
 
-    def load_tasks(self, file_path):
-        try:
-            with open(file_path, 'r') as json_file:
-                loaded_dict = json.load(json_file)
-                return loaded_dict
-        except FileNotFoundError:
-            print(f"File '{file_path}' not found. Creating a new empty dictionary.")
-            with open(file_path, 'w') as json_file:
-                json.dump({}, json_file)
-            return {}
-        except json.decoder.JSONDecodeError as e:
-            print(f"JSON file is empty or corrupt. Returning an empty dictionary. {e}")
-            return {}
+    def next_page(self):
+        self.page = min(self.page + 1, self.page_count() - 1)
 
-    def save_tasks(self, file_path):
-        with open(file_path, 'w') as json_file:
-            json.dump(self.tasks_dict, json_file, indent=4)
-            print("Tasks were successfully saved")
-            
-    def sort_tasks_by_date(self, tasks):
-        return sorted(tasks, key=lambda x: datetime.strptime(x[0]["date"], '%m/%d/%y %H:%M:%S'))
+    def previous_page(self):
+        self.page = max(self.page - 1, 0)
 
     def print_tasks(self):
-        os_sys('cls' if os_name == 'nt' else 'clear')  # Clear terminal command
+        clear_screen()
         print("""
                             SCHOOL TO DO LIST
             """)
-        
-        headers = ["Task Description", "Category", "Status", "Due Date", "Task ID"]
 
-        completed_tasks = []
-        all_other_tasks = []
+        # Pages run through the in progress tasks and then the completed ones, both already in due date order
+        self.page = min(self.page, self.page_count() - 1)
+        start = self.page * self.page_size
+        stop = start + self.page_size
+        in_progress_count = self.count_tasks(completed=False)
 
-        for task_id, task in self.tasks_dict.items():
-            if task["status"] == 'Completed':
-                completed_tasks.append([task, task_id])
+        if start < in_progress_count or not in_progress_count:
+            print("In Progress Tasks:")
+            page = self.page_tasks(False, start, stop)
+            self.renderer.render(self.table_row(task_id, task) for task_id, task in page)
+
+        if stop > in_progress_count and self.count_tasks(completed=True):
+            page = self.page_tasks(True, max(start - in_progress_count, 0), stop - in_progress_count)
+            print("\nCompleted Tasks:")
+            self.renderer.render(self.table_row(task_id, task) for task_id, task in page)
+
+        print(f"\nPage {self.page + 1} of {self.page_count()}")
+
+
+class SQLiteToDoList(ToDoList):
+    """
+    A to-do list kept in a SQLite database instead of in memory.
+
+    Every read goes to the database, so nothing is parsed at startup beyond a
+    one-time migration of an existing JSON tasks file, and listing, expiry and
+    filtering are answered by indexed queries. Edits are committed together
+    when the list is saved.
+    """
+
+    def __init__(self, page_size=DEFAULT_PAGE_SIZE):
+        super().__init__(page_size, index_descriptions=False)
+
+    def __contains__(self, task_id):
+        return self.storage.contains(task_id)
+
+    def get_task(self, task_id):
+        return self.storage.get(task_id)
+
+    def task_count(self):
+        return self.storage.count()
+
+    def count_tasks(self, completed):
+        return self.storage.count(completed)
+
+    def page_tasks(self, completed, start, stop):
+        return self.storage.page(completed, start, stop)
+
+    def iter_tasks(self):
+        return self.storage.iter_all()
+
+    def add_task_to_dict(self, new_task):
+        task_id = self.generate_random_id()
+        self.storage.insert_many([(task_id, new_task)])
+        return task_id
+
+    def add_tasks(self, new_tasks):
+        batch = {}
+        for task_id, task in new_tasks:
+            while task_id is None or task_id in batch or task_id in self:
+                task_id = self.generate_random_id()
+            batch[task_id] = task
+        self.storage.insert_many(batch.items())
+        return list(batch)
+
+    def replace_task(self, task_id, task):
+        self.storage.update(task_id, task)
+
+    def remove_task_by_id(self, task_id):
+        return self.storage.delete(task_id)
+
+    def clear_expired_dates(self):
+        for task_id, date in self.storage.undated():
+            if date is None:
+                print(f"Error: 'date' key not found in task {task_id}. Skipping task.")
             else:
-                all_other_tasks.append([task, task_id])
+                print(f"Error: Invalid date format in task {task_id}. Skipping task.")
 
-        # Sort tasks by date before creating table data
-        sorted_incomplete_tasks = self.sort_tasks_by_date(all_other_tasks)
-        sorted_completed_tasks = self.sort_tasks_by_date(completed_tasks)
+        self.storage.delete_due_before(datetime.now().timestamp())
+        print("Expired tasks removed successfully.")
 
-        incomplete_data = [[task[0]["description"], task[0]["category"], task[0]["status"], task[0]["date"], task[1]]
-                        for task in sorted_incomplete_tasks]
+    def load_tasks(self, file_path):
+        # The database sits next to the JSON file it migrates from
+        db_path = os.path.splitext(file_path)[0] + ".db"
+        self.storage = SQLiteStorage(db_path, COMPLETED)
+        if file_path != db_path:
+            self.storage.migrate(file_path)
 
-        incomplete_table = tabulate(incomplete_data, headers=headers, tablefmt="grid")
-        print("In Progress Tasks:")
-        print(incomplete_table)
+    def save_tasks(self, file_path):
+        self.storage.commit()
+        print("Tasks were successfully saved")
 
-        if sorted_completed_tasks:
-            completed_data = [[task[0]["description"], task[0]["category"], task[0]["status"], task[0]["date"], task[1]]
-                            for task in sorted_completed_tasks]
-            completed_table = tabulate(completed_data, headers=headers, tablefmt="grid")
-            print("\nCompleted Tasks:")
-            print(completed_table)
+    def query(self, status=None, category=None, text=None, after=None, before=None):
+        return self.storage.query(status, category, text, after, before)
 
 
 if __name__ == "__main__":
-    tasks = ToDoList()
-    tasks.tasks_dict = tasks.load_tasks("tasks_dict.json")
+    args = build_parser("tasks_dict.json", DEFAULT_PAGE_SIZE).parse_args()
+    to_do_list_class = SQLiteToDoList if args.backend == "sqlite" else ToDoList
+    tasks = to_do_list_class(page_size=max(args.page_size, 1))
+    # Subcommands print their results on stdout, so loading messages go to stderr there
+    with redirect_stdout(sys.stderr) if args.command else nullcontext():
+        tasks.load_tasks(args.file)
+
+    if args.command:
+        sys.exit(run_command(tasks, args))
+
+    if os_name == 'nt':
+        os_sys('')  # Lets the Windows console interpret the ANSI escape used to clear the screen
+
     tasks.clear_expired_dates()
 
     while True:
@@ -314,8 +582,12 @@ if __name__ == "__main__":
                 elif menu_choice == 4:
                     tasks.update_task()
                 elif menu_choice == 5:
-                    tasks.save_tasks("tasks_dict.json")
+                    tasks.save_tasks(args.file)
                     break
+        elif home_choice == 'n':
+            tasks.next_page()
+        elif home_choice == 'p':
+            tasks.previous_page()
         elif home_choice == 'e':
             break
 
@@ -1,30 +1,13 @@
-from turtle import Turtle
-import random
-COLORS = ["red", "orange", "yellow", "green", "blue", "purple"]
-STARTING_MOVE_DISTANCE = 5
-MOVE_INCREMENT = 5
+from game_common.sprites import SpriteBatch
+CAR_WIDTH = 40
+CAR_HEIGHT = 20
 
 
 class CarManager:
 
-    def __init__(self):
-        self.all_cars = []
-        self.car_speed = STARTING_MOVE_DISTANCE
+    def __init__(self, screen):
+        self.sprites = SpriteBatch(screen, CAR_WIDTH, CAR_HEIGHT)
 
-    def create_car(self):
-        random_chance = random.randint(1, 6)
-        if random_chance == 1:
-            new_car = Turtle("square")
-            new_car.shapesize(stretch_wid=1, stretch_len=2)
-            new_car.color(random.choice(COLORS))
-            new_car.penup()
-            random_y = random.randint(-250, 250)
-            new_car.goto(300, random_y)
-            self.all_cars.append(new_car)
-
-    def move_cars(self):
-        for car in self.all_cars:
-            car.backward(self.car_speed)
-
-    def level_up(self):
-        self.car_speed += MOVE_INCREMENT
+    def render(self, cars):
+        # Draws CrossingEngine's cars. Squares of culled cars are hidden and reused by the next ones
+        self.sprites.render([(car.x, car.y) for car in cars], [car.color for car in cars])
@@ -0,0 +1,123 @@
+from bisect import bisect_right
+from collections import deque
+import math
+import random
+COLORS = ["red", "orange", "yellow", "green", "blue", "purple"]
+STARTING_MOVE_DISTANCE = 5
+MOVE_INCREMENT = 5
+SPAWN_CHANCE = 6  # A new car appears on one tick in SPAWN_CHANCE
+SPAWN_X = 300
+LANE_RANGE = 250
+STARTING_POSITION = (0, -280)
+MOVE_DISTANCE = 10
+FINISH_LINE_Y = 280
+HIT_DISTANCE = 20
+CULL_X = -320  # A car this far left is off the screen for good
+LANE_HEIGHT = HIT_DISTANCE
+LANES = 2 * LANE_RANGE // LANE_HEIGHT + 1
+
+
+class Car:
+    __slots__ = ("x", "y", "color")
+
+    def __init__(self, x, y, color):
+        self.x = x
+        self.y = y
+        self.color = color
+
+
+class CrossingEngine:
+    """
+    The rules of the turtle crossing game without any drawing.
+
+    Follows CarManager, Player and the checks in main.py: a car may spawn at
+    the right edge each tick, every car drives car_speed to the left, the
+    player dies within HIT_DISTANCE of a car and goes back to the start one
+    level up, with faster cars, after crossing FINISH_LINE_Y. Every random
+    number comes from rng, so a seeded random.Random replays a game exactly.
+
+    Cars are dropped once they pass CULL_X, so the number of live cars stays
+    bounded however long the game runs. They all spawn at SPAWN_X and move
+    at the same speed, so the oldest car is always the furthest left and
+    culling only looks at the front of the deque.
+
+    The same cars are also kept in lanes, bands of LANE_HEIGHT in y, and
+    for the same reason each lane is sorted by x. A car can only hit the
+    player from the lanes within HIT_DISTANCE of its y, and only near its x,
+    so the collision check bisects at most three short lanes instead of
+    measuring the distance to every car.
+    """
+
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+        self.cars = deque()
+        self.lanes = [deque() for _ in range(LANES)]
+        self.car_speed = STARTING_MOVE_DISTANCE
+        self.player_x, self.player_y = STARTING_POSITION
+        self.level = 1
+        self.game_over = False
+
+    @property
+    def player(self):
+        return self.player_x, self.player_y
+
+    def move(self):
+        self.player_y += MOVE_DISTANCE
+
+    def go_to_start(self):
+        self.player_x, self.player_y = STARTING_POSITION
+
+    @staticmethod
+    def lane(y):
+        return (y + LANE_RANGE) // LANE_HEIGHT
+
+    def create_car(self):
+        if self.rng.randint(1, SPAWN_CHANCE) == 1:
+            color = self.rng.choice(COLORS)
+            new_car = Car(SPAWN_X, self.rng.randint(-LANE_RANGE, LANE_RANGE), color)
+            self.cars.append(new_car)
+            self.lanes[self.lane(new_car.y)].append(new_car)
+
+    def move_cars(self):
+        for car in self.cars:
+            car.x -= self.car_speed
+        while self.cars and self.cars[0].x < CULL_X:
+            # The oldest car overall is also the first one in its lane
+            self.lanes[self.lane(self.cars.popleft().y)].popleft()
+
+    def hits_player(self):
+        first_lane = max(self.lane(self.player_y - HIT_DISTANCE), 0)
+        last_lane = min(self.lane(self.player_y + HIT_DISTANCE), LANES - 1)
+        for lane in self.lanes[first_lane:last_lane + 1]:
+            # Cars further left than player_x - HIT_DISTANCE cannot be close enough
+            i = bisect_right(lane, self.player_x - HIT_DISTANCE, key=lambda car: car.x)
+            while i < len(lane) and lane[i].x < self.player_x + HIT_DISTANCE:
+                if math.hypot(lane[i].x - self.player_x, lane[i].y - self.player_y) < HIT_DISTANCE:
+                    return True
+                i += 1
+        return False
+
+    def level_up(self):
+        self.car_speed += MOVE_INCREMENT
+        self.level += 1
+
+    def step(self):
+        """
+        Spawns and moves the cars, then applies the collision and finish line rules.
+        Returns:
+            tuple: (leveled, crashed) for this tick. A crash ends the game.
+        """
+        self.create_car()
+        self.move_cars()
+        leveled = crashed = False
+
+        # Detect when turtle collides with a car
+        if self.hits_player():
+            crashed = self.game_over = True
+
+        # Detect when player has reached the top edge of the screen
+        if self.player_y > FINISH_LINE_Y:
+            self.go_to_start()
+            self.level_up()
+            leveled = True
+        return leveled, crashed
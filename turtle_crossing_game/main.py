@@ -1,38 +1,69 @@
-import time
+import argparse
+import atexit
+import os
+import random
+import sys
 from turtle import Screen
+from engine import CrossingEngine
 from player import Player
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from game_common.loop import GameLoop
+from game_common.replay import Recorder, Replay, new_seed, parse_seed
 from car_manager import CarManager
 from scoreboard import Scoreboard
 
+KEYS = {"Up": "move"}
+TICK_LENGTH = 0.1
+
+parser = argparse.ArgumentParser(description="Play the turtle crossing game, or play a recorded game back "
+                                             "without a window.")
+parser.add_argument("--seed", type=parse_seed, help="random seed for the cars")
+parser.add_argument("--record", metavar="PATH", help="save a replay of the game to PATH when it is closed")
+parser.add_argument("--replay", metavar="PATH", help="play a replay back at full speed and print how it ended")
+args = parser.parse_args()
+
+if args.replay:
+    replay = Replay.load(args.replay, "crossing")
+    engine = replay.play(CrossingEngine(rng=random.Random(replay.seed)), KEYS)
+    print(f"Ticks: {replay.ticks}, level: {engine.level}, game over: {engine.game_over}, "
+          f"player: {engine.player}, cars: {len(engine.cars)}")
+    sys.exit()
+
 screen = Screen()
 screen.setup(width=600, height=600)
 screen.tracer(0)
 
-player = Player()
-car_manager = CarManager()
-scoreboard = Scoreboard()
+seed = new_seed() if args.seed is None else args.seed
+engine = CrossingEngine(rng=random.Random(seed))
+recorder = Recorder("crossing", KEYS, engine, seed)
+if args.record:
+    atexit.register(recorder.save, args.record)
+player = Player(engine.player)
+car_manager = CarManager(screen)
+scoreboard = Scoreboard(screen)
 
 screen.listen()
-screen.onkey(player.move, "Up")
-
-game_is_on = True
-while game_is_on:
-    time.sleep(0.1)
-    screen.update()
-
-    car_manager.create_car()
-    car_manager.move_cars()
-
-    # Detect when turtle collides with a car
-    for car in car_manager.all_cars:
-        if car.distance(player) < 20:
-            game_is_on = False
-            scoreboard.game_over()
-
-    # Detect when player has reached the top edge of the screen
-    if player.is_at_finish_line():
-        player.go_to_start()
-        car_manager.level_up()
+recorder.bind(screen.onkey)
+
+
+def tick():
+    leveled, crashed = recorder.step()
+
+    if crashed:
+        loop.stop()
+        scoreboard.game_over()
+        screen.onclick(lambda x, y: screen.bye())
+
+    if leveled:
         scoreboard.increase_level()
 
-screen.exitonclick()
+
+def render():
+    car_manager.render(engine.cars)
+    player.render(engine.player)
+    scoreboard.render()
+
+
+loop = GameLoop(screen, tick, render, lambda: TICK_LENGTH)
+loop.start()
+screen.mainloop()
@@ -1,23 +1,15 @@
 from turtle import Turtle
-STARTING_POSITION = (0, -280)
-MOVE_DISTANCE = 10
-FINISH_LINE_Y = 280
 
 
 class Player(Turtle):
 
-    def __init__(self):
+    def __init__(self, position):
         super().__init__()
         self.shape("turtle")
         self.penup()
-        self.go_to_start()
+        self.goto(position)
         self.setheading(90)
 
-    def move(self):
-        self.forward(MOVE_DISTANCE)
-
-    def go_to_start(self):
-        self.goto(STARTING_POSITION)
-
-    def is_at_finish_line(self):
-        return self.ycor() > FINISH_LINE_Y
+    def render(self, position):
+        # CrossingEngine moves the player, this only puts the turtle where it is
+        self.goto(position)
@@ -1,25 +1,26 @@
-from turtle import Turtle
+from game_common.text import CanvasText
 FONT = ("Courier", 24, "normal")
 
 
-class Scoreboard(Turtle):
+class Scoreboard:
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, screen):
         self.level = 1
-        self.hideturtle()
-        self.penup()
-        self.goto(-280, 260)
+        self.level_text = CanvasText(screen, (-280, 260), align="left", font=FONT)
+        self.game_over_text = CanvasText(screen, (0, 0), align="center", font=FONT)
         self.update_scoreboard()
 
     def update_scoreboard(self):
-        self.clear()
-        self.write(f"Level: {self.level}", align="left", font=FONT)
+        # Only marks the text as changed, render() draws it once per frame
+        self.level_text.set(f"Level: {self.level}")
+
+    def render(self):
+        self.level_text.render()
+        self.game_over_text.render()
 
     def increase_level(self):
         self.level += 1
         self.update_scoreboard()
 
     def game_over(self):
-        self.goto(0, 0)
-        self.write("GAME OVER", align="center", font=FONT)
+        self.game_over_text.set("GAME OVER")